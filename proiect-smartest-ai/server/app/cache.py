@@ -0,0 +1,74 @@
+"""
+Cache LRU cu expirare (TTL) și memorie limitată, folosit pentru rezultatele solverilor.
+
+Fiecare intrare are un cost aproximativ (ex. dimensiunea problemei); când numărul
+de intrări sau costul total depășesc limita, se scot cele mai vechi intrări
+nefolosite. Contoarele de hit / miss / evicție se văd în `stats()`.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class LRUCache:
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 3600.0, max_cost: int = 5_000_000):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_cost = max_cost
+        self._items: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._cost = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            value, expires, cost = item
+            if expires and expires < time.monotonic():
+                del self._items[key]
+                self._cost -= cost
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, cost: int = 1) -> None:
+        if cost > self.max_cost:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._cost -= old[2]
+            expires = time.monotonic() + self.ttl if self.ttl else 0.0
+            self._items[key] = (value, expires, cost)
+            self._cost += cost
+            while len(self._items) > self.maxsize or self._cost > self.max_cost:
+                _, (_, _, evicted_cost) = self._items.popitem(last=False)
+                self._cost -= evicted_cost
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._cost = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._items),
+                "cost": self._cost,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
@@ -0,0 +1,169 @@
+"""
+Filtrare Régin pentru constrângerea globală alldiff.
+
+Construim graful bipartit variabile–valori și o cuplare maximă. Dacă nu acoperă
+toate variabilele, constrângerea e nesatisfiabilă. Altfel, o muchie (x, v) din
+afara cuplării are suport doar dacă stă pe un ciclu alternant (x și v în aceeași
+componentă tare conexă) sau pe un drum alternant care pornește dintr-o valoare
+liberă. Toate celelalte valori se scot din domenii: rezultatul este arc-consistență
+generalizată într-un singur propagator, în loc de k(k-1)/2 inegalități.
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+
+def _bits(mask: int) -> List[int]:
+    out = []
+    while mask:
+        low = mask & -mask
+        out.append(low.bit_length() - 1)
+        mask ^= low
+    return out
+
+
+def _maximum_matching(adj: List[List[int]]):
+    """Cuplare maximă var -> valoare (Kuhn, DFS iterativ). Întoarce (match_var, match_val) sau None."""
+    k = len(adj)
+    match_var = [-1] * k
+    match_val: Dict[int, int] = {}
+
+    # inițializare greedy, variabilele cu domenii mici primele
+    for x in sorted(range(k), key=lambda i: len(adj[i])):
+        for v in adj[x]:
+            if v not in match_val:
+                match_var[x], match_val[v] = v, x
+                break
+
+    for root in range(k):
+        if match_var[root] >= 0:
+            continue
+        seen = set()
+        stack = [(root, iter(adj[root]))]
+        via: List[int] = []           # via[i] = valoarea prin care am ajuns la stack[i + 1]
+        found = False
+        while stack and not found:
+            x, it = stack[-1]
+            for v in it:
+                if v in seen:
+                    continue
+                seen.add(v)
+                y = match_val.get(v)
+                if y is None:
+                    # drum de creștere: fiecare variabilă de pe stivă trece pe valoarea următoare
+                    for (xx, _), vv in zip(stack, via + [v]):
+                        match_var[xx], match_val[vv] = vv, xx
+                    found = True
+                else:
+                    via.append(v)
+                    stack.append((y, iter(adj[y])))
+                break
+            else:
+                stack.pop()
+                if via:
+                    via.pop()
+        if not found:
+            return None
+    return match_var, match_val
+
+
+def _strongly_connected(n: int, edges: List[List[int]]) -> List[int]:
+    """Tarjan iterativ; întoarce id-ul componentei pentru fiecare nod."""
+    index = [-1] * n
+    low = [0] * n
+    comp = [-1] * n
+    on_stack = [False] * n
+    stack: List[int] = []
+    counter = 0
+    n_comp = 0
+    for start in range(n):
+        if index[start] >= 0:
+            continue
+        work = [(start, 0)]
+        while work:
+            node, i = work[-1]
+            if i == 0:
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            if i < len(edges[node]):
+                work[-1] = (node, i + 1)
+                nxt = edges[node][i]
+                if index[nxt] < 0:
+                    work.append((nxt, 0))
+                elif on_stack[nxt]:
+                    low[node] = min(low[node], index[nxt])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    comp[w] = n_comp
+                    if w == node:
+                        break
+                n_comp += 1
+    return comp
+
+
+def filter_alldiff(group: Sequence[int], dom: List[int], trail: List[Tuple[int, int]],
+                   stats: Dict[str, int]) -> Tuple[bool, List[int]]:
+    """
+    Aplică filtrarea Régin pe variabilele din `group` (domenii bitset în `dom`).
+
+    Modificările se înregistrează în `trail` ca (variabilă, domeniu vechi).
+    Întoarce (consistent, variabilele ale căror domenii s-au micșorat).
+    """
+    adj = [_bits(dom[x]) for x in group]
+    stats["checks"] += 1
+    matching = _maximum_matching(adj)
+    if matching is None:
+        return False, []
+    match_var, match_val = matching
+
+    # noduri: variabilele 0..k-1, apoi valorile
+    k = len(group)
+    node_of: Dict[int, int] = {}
+    for vids in adj:
+        for v in vids:
+            if v not in node_of:
+                node_of[v] = k + len(node_of)
+    edges: List[List[int]] = [[] for _ in range(k + len(node_of))]
+    for x, vids in enumerate(adj):
+        for v in vids:
+            if match_var[x] == v:
+                edges[x].append(node_of[v])          # muchie din cuplare: var -> valoare
+            else:
+                edges[node_of[v]].append(x)          # restul: valoare -> var
+
+    # valorile atinse de un drum alternant dintr-o valoare liberă
+    reachable = [False] * len(edges)
+    frontier = [node for v, node in node_of.items() if v not in match_val]
+    for node in frontier:
+        reachable[node] = True
+    while frontier:
+        node = frontier.pop()
+        for nxt in edges[node]:
+            if not reachable[nxt]:
+                reachable[nxt] = True
+                frontier.append(nxt)
+
+    comp = _strongly_connected(len(edges), edges)
+
+    changed: List[int] = []
+    for x, vids in enumerate(adj):
+        remove = 0
+        for v in vids:
+            node = node_of[v]
+            if match_var[x] != v and not reachable[node] and comp[node] != comp[x]:
+                remove |= 1 << v
+        if remove:
+            var = group[x]
+            trail.append((var, dom[var]))
+            dom[var] &= ~remove
+            stats["prunes"] += remove.bit_count()
+            changed.append(var)
+    return True, changed
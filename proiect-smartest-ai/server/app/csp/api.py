@@ -1,22 +1,258 @@
-from fastapi import APIRouter
-from .models import CSPProblem, CSPSolution
-from .logic import backtracking, backtracking_mrv
+import json
+from functools import partial
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
+from .models import (
+    CSPProblem, CSPSolution, JobRequest, JobStatus, LocalSearchRequest, PortfolioSolution, WorkerReport,
+)
+from .logic import backtracking, backtracking_mrv, trace_backtracking, trace_backtracking_mrv
+from .constraints import expand_constraints, split_constraints
+from .propagation import backtracking_fc, backtracking_ac3, iter_solutions, new_stats
+from .search import backtracking_cbj
+from .local_search import min_conflicts
+from .budget import SearchBudget
+from .decomposition import count_solutions, iter_all_solutions, solve_by_components
+from .portfolio import DEFAULT_TIME_LIMIT, MAX_TIME_LIMIT, solve_portfolio
+from .jobs import JobQueueFull, jobs
+from .canonical import csp_cache, solve_cached
+from .trace import throttle
+from .workers import PoolBusy
+from .wire import decode_problem, encode_result
+from app.wire import UnsupportedFormat, media_type
 
 router = APIRouter(prefix="/csp", tags=["csp"])
 
+def _check_constraints(problem: CSPProblem) -> None:
+    """400 pentru constrângeri malformate, înainte să pornească vreun solver (sau vreun flux)."""
+    try:
+        split_constraints(problem.constraints)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.post("/solve", response_model=CSPSolution)
 def solve_csp(problem: CSPProblem):
-    solution, steps = backtracking(problem.variables, problem.domains, problem.constraints)
+    _check_constraints(problem)
+    solution, steps = solve_cached(
+        "backtracking", backtracking,
+        problem.variables, problem.domains, expand_constraints(problem.constraints),
+    )
 
     if not solution:
         return CSPSolution(solution={}, steps=steps, message="Nu există soluție validă.")
 
     return CSPSolution(solution=solution, steps=steps, message="Soluție găsită.")
 @router.post("/solve-mrv", response_model=CSPSolution)
-def solve_csp_mrv(problem: CSPProblem):
-    solution, steps = backtracking_mrv(problem.variables, problem.domains, problem.constraints)
+def solve_csp_mrv(
+    problem: CSPProblem,
+    tie_break: Literal["none", "degree", "domwdeg"] = "none",
+    value_order: Literal["static", "lcv"] = "static",
+):
+    _check_constraints(problem)
+    solution, steps = solve_cached(
+        "backtracking_mrv", backtracking_mrv,
+        problem.variables, problem.domains, problem.constraints,
+        tie_break=tie_break, value_order=value_order,
+    )
 
     if not solution:
         return CSPSolution(solution={}, steps=steps, message="Nu există soluție validă (MRV).")
 
     return CSPSolution(solution=solution, steps=steps, message="Soluție găsită cu MRV.")
+
+@router.get("/cache")
+def csp_cache_stats():
+    return csp_cache.stats()
+
+def _solve_components(problem: CSPProblem, solver, parallel: bool):
+    _check_constraints(problem)
+    try:
+        return solve_by_components(
+            problem.variables, problem.domains, problem.constraints, solver, parallel=parallel,
+        )
+    except PoolBusy:
+        raise HTTPException(status_code=429, detail="Prea multe rezolvări paralele în curs.")
+
+@router.post("/solve-fc", response_model=CSPSolution)
+def solve_csp_fc(problem: CSPProblem, parallel: bool = False):
+    solution, stats = _solve_components(problem, backtracking_fc, parallel)
+
+    if solution is None:
+        return CSPSolution(solution={}, steps=stats["nodes"], stats=stats, message="Nu există soluție validă (FC).")
+
+    return CSPSolution(solution=solution, steps=stats["nodes"], stats=stats, message="Soluție găsită cu forward checking.")
+
+@router.post("/solve-ac3", response_model=CSPSolution)
+def solve_csp_ac3(problem: CSPProblem, parallel: bool = False):
+    solution, stats = _solve_components(problem, backtracking_ac3, parallel)
+
+    if solution is None:
+        return CSPSolution(solution={}, steps=stats["nodes"], stats=stats, message="Nu există soluție validă (AC-3).")
+
+    return CSPSolution(solution=solution, steps=stats["nodes"], stats=stats, message="Soluție găsită cu AC-3.")
+
+@router.post("/solve-cbj", response_model=CSPSolution)
+def solve_csp_cbj(problem: CSPProblem, restarts: bool = True, seed: int = 0, parallel: bool = False):
+    solution, stats = _solve_components(problem, partial(backtracking_cbj, restarts=restarts, seed=seed), parallel)
+
+    if solution is None:
+        return CSPSolution(solution={}, steps=stats["nodes"], stats=stats, message="Nu există soluție validă (CBJ).")
+
+    return CSPSolution(solution=solution, steps=stats["nodes"], stats=stats, message="Soluție găsită cu backjumping.")
+
+@router.post("/solve-local", response_model=CSPSolution)
+def solve_csp_local(request: LocalSearchRequest):
+    _check_constraints(request)
+    solution, stats = min_conflicts(
+        request.variables, request.domains, request.constraints,
+        initial=request.warm_start, max_steps=request.max_steps, seed=request.seed,
+    )
+
+    if solution is None:
+        return CSPSolution(
+            solution={}, steps=stats["moves"], stats=stats,
+            message="Nu s-a găsit soluție în limita de pași (min-conflicts).",
+        )
+
+    return CSPSolution(solution=solution, steps=stats["moves"], stats=stats, message="Soluție găsită cu min-conflicts.")
+
+@router.post("/solve-compact")
+async def solve_csp_compact(request: Request):
+    """
+    Problema în format compact (JSON, msgpack sau binar, vezi app/csp/wire.py),
+    rezolvată cu AC-3; răspunsul vine în aceeași codificare.
+    """
+    try:
+        kind = media_type(request.headers.get("content-type"))
+    except UnsupportedFormat as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    body = await request.body()
+
+    def solve():
+        csp = decode_problem(body, kind)
+        stats = new_stats()
+        assignment = next(iter_solutions(csp, "ac3", stats, indexed=True), None)
+        return encode_result(assignment, "solved" if assignment is not None else "unsat", stats, kind)
+
+    try:
+        content, headers = await run_in_threadpool(solve)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content, media_type=kind, headers=headers)
+
+@router.post("/count")
+def count_csp_solutions(problem: CSPProblem, time_limit: float = Query(5.0, gt=0, le=30)):
+    """Numărul de soluții; numărarea se oprește după `time_limit` secunde, cu `complete: false`."""
+    _check_constraints(problem)
+    budget = SearchBudget(time_limit=time_limit)
+    count, components = count_solutions(problem.variables, problem.domains, problem.constraints, budget=budget)
+    if count is None:
+        return {"count": None, "components": components, "complete": False,
+                "message": "Numărarea nu s-a terminat în limita de timp."}
+    return {"count": count, "components": components, "complete": True}
+
+@router.post("/solutions")
+def stream_csp_solutions(problem: CSPProblem, limit: Optional[int] = None):
+    """Toate soluțiile, ca NDJSON (o soluție pe linie), generate pe măsură ce sunt trimise."""
+    _check_constraints(problem)
+    def lines():
+        for k, solution in enumerate(iter_all_solutions(problem.variables, problem.domains, problem.constraints)):
+            if limit is not None and k >= limit:
+                break
+            yield json.dumps(solution, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.post("/trace")
+def trace_csp(
+    problem: CSPProblem,
+    solver: Literal["backtracking", "mrv"] = "backtracking",
+    tie_break: Literal["none", "degree", "domwdeg"] = "none",
+    value_order: Literal["static", "lcv"] = "static",
+    sample: int = Query(1, ge=1),
+    max_rate: Optional[float] = Query(None, gt=0),
+    max_events: int = Query(10_000, ge=1, le=1_000_000),
+):
+    """Evenimentele căutării (assign / check / prune / backtrack / done) ca NDJSON, pe măsură ce apar."""
+    _check_constraints(problem)
+    if solver == "mrv":
+        events = trace_backtracking_mrv(problem.variables, problem.domains, problem.constraints,
+                                        tie_break=tie_break, value_order=value_order)
+    else:
+        events = trace_backtracking(problem.variables, problem.domains, expand_constraints(problem.constraints))
+
+    async def lines():
+        async for event in throttle(events, sample=sample, max_rate=max_rate, max_events=max_events):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+@router.post("/solve-portfolio", response_model=PortfolioSolution)
+def solve_csp_portfolio(
+    problem: CSPProblem,
+    configs: Optional[List[str]] = Query(None),
+    time_limit: float = Query(DEFAULT_TIME_LIMIT, gt=0, le=MAX_TIME_LIMIT),
+):
+    _check_constraints(problem)
+    try:
+        winner, reports = solve_portfolio(
+            problem.variables, problem.domains, problem.constraints,
+            configs=configs, time_limit=time_limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PoolBusy:
+        raise HTTPException(status_code=429, detail="Prea multe rezolvări paralele în curs.")
+
+    workers = [WorkerReport(**{k: r[k] for k in ("config", "status", "time_ms", "stats")}) for r in reports]
+
+    if winner is None:
+        return PortfolioSolution(solution={}, steps=0, workers=workers,
+                                 message="Niciun solver nu a terminat în limita de timp.")
+
+    steps = winner["stats"].get("nodes", winner["stats"].get("moves", 0))
+    if winner["status"] == "unsat":
+        return PortfolioSolution(solution={}, steps=steps, stats=winner["stats"], winner=winner["config"],
+                                 workers=workers, message="Nu există soluție validă (portofoliu).")
+
+    return PortfolioSolution(solution=winner["solution"], steps=steps, stats=winner["stats"],
+                             winner=winner["config"], workers=workers,
+                             message=f"Soluție găsită de {winner['config']} (portofoliu).")
+
+# -------------------------------------------------
+# Joburi asincrone (pool de procese, nu threadpool-ul serverului)
+# -------------------------------------------------
+
+def _get_job(job_id: str):
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job inexistent.")
+    return job
+
+@router.post("/jobs", response_model=JobStatus, status_code=202)
+async def submit_csp_job(request: JobRequest):
+    _check_constraints(request)
+    try:
+        job_id = jobs.submit(
+            request.solver, request.variables, request.domains, request.constraints,
+            max_nodes=request.max_nodes, time_limit=request.time_limit,
+        )
+    except KeyError:
+        raise HTTPException(status_code=400, detail=f"Solver necunoscut: {request.solver}")
+    except JobQueueFull:
+        raise HTTPException(status_code=429, detail="Prea multe joburi în așteptare.")
+    return jobs.status(jobs.get(job_id))
+
+@router.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_csp_job(job_id: str):
+    return jobs.status(_get_job(job_id))
+
+@router.get("/jobs/{job_id}/result", response_model=JobStatus)
+async def wait_csp_job(job_id: str, timeout: float = 30.0):
+    return await jobs.wait(_get_job(job_id), timeout=timeout)
+
+@router.delete("/jobs/{job_id}", response_model=JobStatus)
+async def cancel_csp_job(job_id: str):
+    return jobs.cancel(_get_job(job_id))
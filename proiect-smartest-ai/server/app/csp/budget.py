@@ -0,0 +1,42 @@
+"""
+Bugete de căutare: limită de noduri, limită de timp și anulare din exterior.
+
+Solverii apelează `tick()` o dată per nod. Timpul și evenimentul de anulare se
+verifică doar la câteva sute de noduri, ca verificarea să nu coste nimic vizibil.
+Când bugetul se termină, solverul lasă în `partial` atribuirea la care ajunsese.
+"""
+
+import time
+from typing import Dict, Optional
+
+
+class SearchBudget:
+    def __init__(self, max_nodes: Optional[int] = None, time_limit: Optional[float] = None,
+                 cancel_event=None, check_every: int = 256):
+        self.max_nodes = max_nodes
+        self.deadline = time.monotonic() + time_limit if time_limit is not None else None
+        self.cancel_event = cancel_event          # orice obiect cu `is_set()` (threading / multiprocessing)
+        self.check_every = check_every
+        self.nodes = 0
+        self.stopped: Optional[str] = None        # "nodes" | "time" | "cancelled"
+        self.partial: Optional[Dict[str, str]] = None
+        self._next_check = 0
+
+    def tick(self) -> bool:
+        """Numără un nod. True dacă solverul trebuie să se oprească."""
+        self.nodes += 1
+        if self.nodes < self._next_check:
+            return False
+        return self.check()
+
+    def check(self) -> bool:
+        self._next_check = self.nodes + self.check_every
+        if self.max_nodes is not None:
+            if self.nodes > self.max_nodes:
+                self.stopped = "nodes"
+            self._next_check = min(self._next_check, self.max_nodes + 1)
+        if self.stopped is None and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.stopped = "time"
+        if self.stopped is None and self.cancel_event is not None and self.cancel_event.is_set():
+            self.stopped = "cancelled"
+        return self.stopped is not None
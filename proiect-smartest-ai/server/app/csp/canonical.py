@@ -0,0 +1,112 @@
+"""
+Forma canonică a unei probleme CSP, folosită drept cheie de cache.
+
+Două probleme care diferă doar prin numele variabilelor, ordinea lor, ordinea
+constrângerilor sau ordinea valorilor din domenii ar trebui să ajungă la aceeași
+cheie. Variabilele se reordonează după culori obținute prin rafinare (domeniu,
+grad, culorile vecinilor), apoi primesc indici 0..n-1. Cheia conține problema
+reindexată complet, deci o coliziune între probleme diferite nu e posibilă;
+în cel mai rău caz (simetrii nedepartajate) pierdem doar un hit.
+
+Soluția se memorează în ordinea canonică și se traduce înapoi în numele
+variabilelor din cererea curentă.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from app.cache import LRUCache
+
+from .constraints import split_constraints
+
+csp_cache = LRUCache(maxsize=1024, ttl=3600.0, max_cost=5_000_000)
+
+_MAX_ROUNDS = 5
+
+
+def canonical_form(variables, domains, constraints) -> Tuple[tuple, List[str]]:
+    """Întoarce (cheia canonică, variabilele originale în ordinea canonică)."""
+    index = {v: i for i, v in enumerate(variables)}
+    n = len(variables)
+    pairs, groups = split_constraints(constraints)
+
+    adjacency: List[List[int]] = [[] for _ in range(n)]
+    edges = set()
+    self_loops = [False] * n
+    for x, y in pairs:
+        i, j = index.get(x), index.get(y)
+        if i is None or j is None:
+            continue
+        if i == j:
+            self_loops[i] = True
+            continue
+        edge = (i, j) if i < j else (j, i)
+        if edge not in edges:
+            edges.add(edge)
+            adjacency[i].append(j)
+            adjacency[j].append(i)
+    scopes = [[index[v] for v in scope if v in index] for scope in groups]
+    memberships: List[List[int]] = [[] for _ in range(n)]
+    for scope in scopes:
+        for i in scope:
+            memberships[i].append(len(scope))
+
+    dom_keys = [tuple(sorted(set(domains.get(v, [])))) for v in variables]
+
+    # rafinare de culori (Weisfeiler–Lehman 1-dim.), independentă de nume
+    signatures = [(dom_keys[i], len(adjacency[i]), self_loops[i], tuple(sorted(memberships[i])))
+                  for i in range(n)]
+    color = _relabel(signatures)
+    for _ in range(_MAX_ROUNDS):
+        refined = _relabel([(color[i], tuple(sorted(color[j] for j in adjacency[i]))) for i in range(n)])
+        if len(set(refined)) == len(set(color)):
+            break
+        color = refined
+
+    order = sorted(range(n), key=lambda i: (color[i], i))
+    position = [0] * n
+    for k, i in enumerate(order):
+        position[i] = k
+
+    key = (
+        tuple(dom_keys[i] for i in order),
+        tuple(k for k, i in enumerate(order) if self_loops[i]),
+        tuple(sorted((min(position[i], position[j]), max(position[i], position[j])) for i, j in edges)),
+        tuple(sorted(tuple(sorted(position[i] for i in scope)) for scope in scopes)),
+    )
+    return key, [variables[i] for i in order]
+
+
+def _key_cost(key: tuple) -> int:
+    """Câte elemente ține cheia canonică: valorile din domenii, buclele, capetele muchiilor, membrii alldiff."""
+    dom_keys, self_loops, edges, scopes = key
+    return (sum(len(d) for d in dom_keys) + len(self_loops) + 2 * len(edges)
+            + sum(len(scope) for scope in scopes))
+
+
+def _relabel(signatures: list) -> List[int]:
+    palette = {sig: c for c, sig in enumerate(sorted(set(signatures)))}
+    return [palette[sig] for sig in signatures]
+
+
+def solve_cached(name: str, solver: Callable, variables, domains, constraints,
+                 **options) -> Tuple[Optional[Dict[str, str]], int]:
+    """
+    Rulează `solver(variables, domains, constraints, **options) -> (soluție, pași)`
+    prin cache. La miss se rezolvă problema exact cum a venit; la hit soluția
+    memorată (în ordinea canonică) se traduce în numele din cererea curentă.
+    """
+    key, order = canonical_form(variables, domains, constraints)
+    key = (name, tuple(sorted(options.items())), key)
+    cached = csp_cache.get(key)
+    if cached is None:
+        solution, steps = solver(variables, domains, constraints, **options)
+        values = None if solution is None else tuple(solution[v] for v in order)
+        # costul acoperă cheia întreagă (cu domeniile) plus soluția, ca `max_cost` să limiteze memoria
+        csp_cache.put(key, (values, steps), cost=_key_cost(key[2]) + len(order))
+        return solution, steps
+
+    values, steps = cached
+    if values is None:
+        return None, steps
+    solution = dict(zip(order, values))
+    return {v: solution[v] for v in variables}, steps
@@ -0,0 +1,45 @@
+"""
+Normalizarea constrângerilor dintr-un `CSPProblem`.
+
+Forma veche, ["X1", "X2"], înseamnă X1 != X2 și rămâne acceptată. Constrângerile
+tipizate sunt obiecte {"type": "neq" | "alldiff", "variables": [...]} (dict sau
+`TypedConstraint`). Solverii care lucrează doar cu perechi primesc un alldiff
+expandat în perechi; motorul de propagare îl păstrează ca o singură constrângere globală.
+O inegalitate (formă veche sau "neq") cu alt număr de variabile decât 2 e o eroare
+(ValueError), nu o constrângere ignorată.
+"""
+
+from itertools import combinations
+from typing import List, Tuple
+
+
+def constraint_scope(constraint) -> Tuple[str, List[str]]:
+    """(tipul constrângerii, variabilele implicate) pentru orice formă acceptată."""
+    if isinstance(constraint, dict):
+        return constraint.get("type", "neq"), list(constraint.get("variables", []))
+    if hasattr(constraint, "variables"):
+        return constraint.type, list(constraint.variables)
+    return "neq", list(constraint)
+
+
+def split_constraints(constraints) -> Tuple[List[List[str]], List[List[str]]]:
+    """Separă constrângerile în (perechi de inegalitate, grupuri alldiff). ValueError pentru o inegalitate care nu e pereche."""
+    pairs: List[List[str]] = []
+    groups: List[List[str]] = []
+    for constraint in constraints:
+        kind, scope = constraint_scope(constraint)
+        if kind == "alldiff":
+            groups.append(scope)
+        elif len(scope) == 2:
+            pairs.append(scope)
+        else:
+            raise ValueError(f"Constrângere invalidă {scope}: o inegalitate are exact 2 variabile.")
+    return pairs, groups
+
+
+def expand_constraints(constraints) -> List[List[str]]:
+    """Doar perechi: fiecare alldiff peste k variabile devine k(k-1)/2 inegalități."""
+    pairs, groups = split_constraints(constraints)
+    for scope in groups:
+        pairs.extend([x, y] for x, y in combinations(scope, 2))
+    return pairs
@@ -0,0 +1,190 @@
+"""
+Descompunerea grafului de constrângeri în componente conexe.
+
+Componentele nu au constrângeri între ele, deci se rezolvă independent (eventual
+în paralel) și soluțiile se lipesc. Un eșec într-o componentă nu mai forțează
+reexplorarea celorlalte, iar numărul de soluții este produsul numărului de
+soluții al fiecărei componente.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.telemetry import capture_searches, replay
+
+from .budget import SearchBudget
+from .constraints import constraint_scope
+from .propagation import compile_problem, iter_solutions, new_stats
+from .workers import SlotFlag, solver_pool
+
+SubProblem = Tuple[List[str], Dict[str, List[str]], list]
+
+
+def split_components(variables, domains, constraints) -> List[SubProblem]:
+    """
+    Împarte problema în subprobleme (variabile, domenii, constrângeri), câte una per componentă.
+    Constrângerile (perechi sau tipizate) își păstrează forma originală.
+    """
+    parent = {v: v for v in variables}
+
+    def find(v):
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    edges = []
+    for constraint in constraints:
+        kind, full = constraint_scope(constraint)
+        scope = [v for v in full if v in parent]
+        # o pereche cu o variabilă necunoscută nu e verificată niciodată
+        if not scope or (kind != "alldiff" and len(scope) != len(full)):
+            continue
+        edges.append((scope[0], constraint))
+        for v in scope[1:]:
+            a, b = find(scope[0]), find(v)
+            if a != b:
+                parent[a] = b
+
+    groups: Dict[str, SubProblem] = {}
+    for v in variables:
+        root = find(v)
+        if root not in groups:
+            groups[root] = ([], {}, [])
+        sub_vars, sub_domains, _ = groups[root]
+        sub_vars.append(v)
+        sub_domains[v] = domains.get(v, [])
+    for anchor, constraint in edges:
+        groups[find(anchor)][2].append(constraint)
+    return list(groups.values())
+
+
+def _merge_stats(total: Dict[str, int], stats: Dict[str, int]) -> None:
+    for key, value in stats.items():
+        total[key] = total.get(key, 0) + value
+
+
+def _solve_component(slot: int, solver: Callable, part: SubProblem):
+    """Rulează în worker: o componentă, cu bugetul legat de slotul de anulare al cererii."""
+    with capture_searches() as published:
+        sub_solution, stats = solver(*part, budget=SearchBudget(cancel_event=SlotFlag(slot)))
+    return sub_solution, stats, published
+
+
+def solve_by_components(variables, domains, constraints, solver: Callable,
+                        parallel: bool = False, budget=None):
+    """
+    Rulează `solver(variables, domains, constraints) -> (soluție | None, statistici)`
+    pe fiecare componentă și combină rezultatele.
+
+    Componentele mici se rezolvă primele, ca o componentă fără soluție să fie
+    găsită repede. Cu `parallel=True` componentele merg în pool-ul comun de procese
+    (`solver` trebuie să fie o funcție de nivel modul, ca să poată fi trimisă în alt proces,
+    și să accepte `budget`). La prima componentă fără soluție, celelalte sunt anulate:
+    cele din coadă nu mai pornesc, iar cele care rulează se opresc la următorul tick.
+
+    Un `budget` (doar în modul secvențial) e împărțit de toate componentele; la oprire,
+    `budget.partial` conține și soluțiile componentelor deja rezolvate.
+    """
+    parts = sorted(split_components(variables, domains, constraints), key=lambda p: len(p[0]))
+    total: Dict[str, int] = {"components": len(parts)}
+    solution: Dict[str, str] = {}
+
+    if not parallel or len(parts) < 2:
+        for part in parts:
+            if budget is not None:
+                sub_solution, stats = solver(*part, budget=budget)
+            else:
+                sub_solution, stats = solver(*part)
+            _merge_stats(total, stats)
+            if sub_solution is None:
+                if budget is not None and budget.stopped:
+                    budget.partial = {**solution, **(budget.partial or {})}
+                return None, total
+            solution.update(sub_solution)
+        return {v: solution[v] for v in variables}, total
+
+    # la ieșirea din `with` (și la primul eșec) componentele rămase sunt anulate
+    with solver_pool.batch() as batch:
+        pending = {batch.submit(_solve_component, solver, part) for part in parts}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                sub_solution, stats, published = future.result()
+                replay(published)
+                _merge_stats(total, stats)
+                if sub_solution is None:
+                    return None, total
+                solution.update(sub_solution)
+    return {v: solution[v] for v in variables}, total
+
+
+# -------------------------------------------------
+# Numărare și enumerare
+# -------------------------------------------------
+
+def _component_count(part: SubProblem, budget=None) -> int:
+    sub_vars, sub_domains, sub_constraints = part
+    csp = compile_problem(sub_vars, sub_domains, sub_constraints, expand_alldiff=False)
+    if len(sub_vars) == 1 and not sub_constraints:
+        return len(csp.orders[0])
+    return sum(1 for _ in iter_solutions(csp, "ac3", new_stats(), budget=budget))
+
+
+def count_solutions(variables, domains, constraints, budget=None) -> Tuple[Optional[int], int]:
+    """
+    Numărul de soluții (produsul pe componente) și numărul de componente.
+
+    Numărarea enumeră soluțiile fiecărei componente, deci poate fi exponențială;
+    un `budget` e împărțit de toate componentele. Dacă se termină, numărul e None
+    (un număr parțial pe o componentă nu spune nimic despre produs) și
+    `budget.stopped` spune de ce.
+    """
+    parts = sorted(split_components(variables, domains, constraints), key=lambda p: len(p[0]))
+    total = 1
+    for part in parts:
+        count = _component_count(part, budget)
+        if budget is not None and budget.stopped:
+            return None, len(parts)
+        total *= count
+        if total == 0:
+            break
+    return total, len(parts)
+
+
+def _component_solutions(part: SubProblem) -> Iterator[Dict[str, str]]:
+    sub_vars, sub_domains, sub_constraints = part
+    csp = compile_problem(sub_vars, sub_domains, sub_constraints, expand_alldiff=False)
+    return iter_solutions(csp, "ac3", new_stats())
+
+
+def iter_all_solutions(variables, domains, constraints) -> Iterator[Dict[str, str]]:
+    """
+    Generează toate soluțiile, una câte una, ca produs cartezian al soluțiilor pe componente.
+
+    Soluțiile componentelor nu se păstrează în memorie: generatorul unei componente
+    se repornește pentru fiecare combinație a componentelor dinaintea ei.
+    Memoria rămâne proporțională cu numărul de componente.
+    """
+    parts = split_components(variables, domains, constraints)
+    # o componentă fără soluții anulează tot produsul; verificăm înainte să emitem ceva
+    if any(next(_component_solutions(part), None) is None for part in parts):
+        return
+
+    if not parts:
+        yield {}
+        return
+
+    # „odometru”: câte un generator activ per componentă, cel mai din dreapta avansează primul
+    partial: Dict[str, str] = {}
+    active = [_component_solutions(parts[0])]
+    while active:
+        sub_solution = next(active[-1], None)
+        if sub_solution is None:
+            active.pop()
+            continue
+        partial.update(sub_solution)
+        if len(active) == len(parts):
+            yield {v: partial[v] for v in variables}
+        else:
+            active.append(_component_solutions(parts[len(active)]))
@@ -0,0 +1,119 @@
+"""
+Euristici incrementale pentru alegerea variabilei și ordonarea valorilor.
+
+`MRVState` ține, pentru fiecare variabilă, câte valori din domeniu mai sunt
+compatibile cu atribuirea curentă. Contoarele se actualizează în O(grad) la
+atribuire / dezatribuire, deci alegerea MRV nu mai reface `is_valid` pentru
+fiecare valoare a fiecărei variabile.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from .propagation import compile_problem
+
+
+class MRVState:
+    """Starea incrementală a căutării MRV (indexată pe întregi, vezi `compile_problem`)."""
+
+    def __init__(self, variables, domains, constraints):
+        csp = compile_problem(variables, domains, constraints)
+        n = len(csp.variables)
+        self.csp = csp
+        self.value = [-1] * n                 # id-ul valorii atribuite sau -1
+        self.unassigned = n
+        # blocked[i][vid] = câți vecini atribuiți au luat valoarea vid (doar pentru vid din domeniul lui i)
+        self.blocked: List[Dict[int, int]] = [{} for _ in range(n)]
+        self.remaining = [len(order) if csp.domains[i] else 0 for i, order in enumerate(csp.orders)]
+        self.free_degree = [len(nb) for nb in csp.neighbours]
+        self.weights: Dict[Tuple[int, int], int] = {}   # ponderi dom/wdeg pe muchii
+
+    # ------------------ atribuire ------------------
+
+    def assign(self, var: int, vid: int) -> bool:
+        """Atribuie var=vid. False dacă un vecin neatribuit a rămas fără valori."""
+        self.value[var] = vid
+        self.unassigned -= 1
+        bit = 1 << vid
+        wiped = False
+        domains, blocked, remaining = self.csp.domains, self.blocked, self.remaining
+        for j in self.csp.neighbours[var]:
+            self.free_degree[j] -= 1
+            if domains[j] & bit:
+                count = blocked[j].get(vid, 0)
+                blocked[j][vid] = count + 1
+                if count == 0:
+                    remaining[j] -= 1
+                    if remaining[j] == 0 and self.value[j] < 0:
+                        wiped = True
+                        edge = (var, j) if var < j else (j, var)
+                        self.weights[edge] = self.weights.get(edge, 1) + 1
+        return not wiped
+
+    def unassign(self, var: int) -> None:
+        vid = self.value[var]
+        self.value[var] = -1
+        self.unassigned += 1
+        bit = 1 << vid
+        domains, blocked, remaining = self.csp.domains, self.blocked, self.remaining
+        for j in self.csp.neighbours[var]:
+            self.free_degree[j] += 1
+            if domains[j] & bit:
+                count = blocked[j][vid] - 1
+                if count:
+                    blocked[j][vid] = count
+                else:
+                    del blocked[j][vid]
+                    remaining[j] += 1
+
+    # ------------------ euristici ------------------
+
+    def _wdeg(self, var: int) -> int:
+        weights = self.weights
+        total = 0
+        for j in self.csp.neighbours[var]:
+            if self.value[j] < 0:
+                edge = (var, j) if var < j else (j, var)
+                total += weights.get(edge, 1)
+        return total
+
+    def select(self, tie_break: str = "none") -> Optional[int]:
+        """MRV: variabila neatribuită cu cele mai puține valori rămase."""
+        best: List[int] = []
+        best_count = None
+        value, remaining = self.value, self.remaining
+        for i in range(len(value)):
+            if value[i] >= 0:
+                continue
+            count = remaining[i]
+            if best_count is None or count < best_count:
+                best, best_count = [i], count
+            elif count == best_count and tie_break != "none":
+                best.append(i)
+        if not best:
+            return None
+        if len(best) == 1 or tie_break == "none":
+            return best[0]
+        if tie_break == "degree":
+            return max(best, key=lambda i: self.free_degree[i])
+        return max(best, key=self._wdeg)
+
+    def ordered_values(self, var: int, value_order: str = "static") -> List[int]:
+        """Valorile încă posibile ale lui `var`; cu "lcv", cele mai puțin restrictive primele."""
+        # masca e 0 când compilarea a golit domeniul (ex. X != X sau X de două ori într-un alldiff)
+        mask = self.csp.domains[var]
+        values = [vid for vid in self.csp.orders[var] if mask >> vid & 1 and not self.blocked[var].get(vid)]
+        if value_order != "lcv" or len(values) < 2:
+            return values
+        domains, blocked, value = self.csp.domains, self.blocked, self.value
+        neighbours = [j for j in self.csp.neighbours[var] if value[j] < 0]
+
+        def ruled_out(vid: int) -> int:
+            bit = 1 << vid
+            return sum(1 for j in neighbours if domains[j] & bit and not blocked[j].get(vid))
+
+        return sorted(values, key=ruled_out)
+
+    def solution(self) -> Dict[str, str]:
+        """Atribuirea curentă (completă la final, parțială dacă căutarea e oprită)."""
+        csp = self.csp
+        return {csp.variables[i]: csp.values[vid] for i, vid in enumerate(self.value) if vid >= 0}
@@ -0,0 +1,154 @@
+"""
+Joburi de rezolvare CSP rulate în afara event loop-ului, într-un pool de procese limitat.
+
+Un job primește un id imediat; rezultatul se interoghează, se așteaptă async sau
+jobul se anulează. Fiecare job are buget de noduri și de timp: la epuizare
+întoarce atribuirea parțială și statisticile căutării, nu o eroare.
+
+Joburile rulează în pool-ul comun de procese (`workers.solver_pool`), fiecare cu
+slotul lui de anulare, citit de bugetul de căutare din worker.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, Optional
+
+from app.telemetry import capture_searches, replay
+
+from .budget import SearchBudget
+from .registry import SOLVERS
+from .workers import Batch, PoolBusy, SlotFlag, SolverPool, solver_pool
+
+MAX_PENDING = 128          # joburi neterminate simultan (restul sloturilor rămân cererilor sincrone)
+MAX_RETAINED = 1000        # joburi terminate păstrate pentru interogare
+DEFAULT_TIME_LIMIT = 60.0  # secunde, dacă cererea nu cere altceva
+
+
+def _run_job(slot: int, solver: str, variables, domains, constraints, max_nodes, time_limit) -> Dict:
+    config = SOLVERS[solver]
+    budget = SearchBudget(max_nodes=max_nodes, time_limit=time_limit, cancel_event=SlotFlag(slot))
+    start = time.perf_counter()
+    with capture_searches() as published:
+        solution, stats = config.run(variables, domains, constraints, budget=budget)
+    if solution is not None:
+        outcome = "solved"
+    elif budget.stopped:
+        outcome = budget.stopped
+    else:
+        outcome = "unsat" if config.complete else "not_found"
+    return {
+        "outcome": outcome,
+        "solution": solution,
+        "partial": budget.partial if solution is None else None,
+        "stats": stats,
+        "time_ms": round(1000 * (time.perf_counter() - start), 3),
+        "published": published,
+    }
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class _Job:
+    __slots__ = ("id", "solver", "future", "batch", "created")
+
+    def __init__(self, job_id: str, solver: str, future: Future, batch: Batch):
+        self.id = job_id
+        self.solver = solver
+        self.future = future
+        self.batch = batch
+        self.created = time.time()
+
+
+class JobManager:
+    def __init__(self, pool: SolverPool = solver_pool, max_pending: int = MAX_PENDING,
+                 max_retained: int = MAX_RETAINED):
+        self.max_pending = max_pending
+        self.max_retained = max_retained
+        self._pool = pool
+        self._pending = 0
+        self._jobs: "OrderedDict[str, _Job]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def submit(self, solver: str, variables, domains, constraints,
+               max_nodes: Optional[int] = None, time_limit: Optional[float] = None) -> str:
+        if solver not in SOLVERS:
+            raise KeyError(solver)
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise JobQueueFull()
+            try:
+                batch = self._pool.batch()
+            except PoolBusy:
+                raise JobQueueFull()
+            try:
+                future = batch.submit(_run_job, solver, variables, domains, constraints, max_nodes,
+                                      time_limit if time_limit is not None else DEFAULT_TIME_LIMIT)
+            finally:
+                # slotul se eliberează abia după terminare, deci anularea nu poate nimeri alt job
+                self._pool.release_after(batch.slot, batch.futures)
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = _Job(job_id, solver, future, batch)
+            self._pending += 1
+            self._evict()
+        future.add_done_callback(self._finished)
+        return job_id
+
+    def _finished(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+        # contoarele din worker rămân în procesul lui; le publicăm aici
+        if not future.cancelled() and future.exception() is None:
+            replay(future.result()["published"])
+
+    def _evict(self) -> None:
+        # păstrăm toate joburile neterminate și cel mult `max_retained` joburi terminate
+        finished = [job_id for job_id, job in self._jobs.items() if job.future.done()]
+        for job_id in finished[:max(0, len(finished) - self.max_retained)]:
+            del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Optional[_Job]:
+        return self._jobs.get(job_id)
+
+    def status(self, job: _Job) -> Dict:
+        future = job.future
+        if not future.done():
+            state = "running" if future.running() else "queued"
+            return {"job_id": job.id, "solver": job.solver, "status": state, "result": None}
+        if future.cancelled():
+            return {"job_id": job.id, "solver": job.solver, "status": "cancelled", "result": None}
+        error = future.exception()
+        if error is not None:
+            return {"job_id": job.id, "solver": job.solver, "status": "failed", "result": None,
+                    "error": repr(error)}
+        result = future.result()
+        state = "cancelled" if result["outcome"] == "cancelled" else "done"
+        return {"job_id": job.id, "solver": job.solver, "status": state, "result": result}
+
+    async def wait(self, job: _Job, timeout: Optional[float] = None) -> Dict:
+        """Așteaptă terminarea fără să blocheze event loop-ul; la timeout întoarce starea curentă."""
+        if not job.future.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(job.future)), timeout)
+            except asyncio.TimeoutError:
+                pass
+            except asyncio.CancelledError:
+                if not job.future.cancelled():
+                    raise
+            except Exception:
+                pass  # eroarea din worker apare în status()
+        return self.status(job)
+
+    def cancel(self, job: _Job) -> Dict:
+        # din coadă: anulat direct; rulează deja: bugetul din worker vede flag-ul
+        if not job.future.done():
+            job.batch.cancel()
+        return self.status(job)
+
+
+jobs = JobManager()
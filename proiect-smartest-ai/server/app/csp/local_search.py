@@ -0,0 +1,138 @@
+"""
+Căutare locală min-conflicts cu listă tabu și pași aleatori (random walk).
+
+Pentru fiecare variabilă ținem un tabel `count[i][vid]` = câți vecini au acum
+valoarea vid. Costul oricărei valori candidate se citește direct din tabel, iar
+o mutare actualizează doar vecinii variabilei mutate, deci costă O(grad) în loc
+de o verificare completă a constrângerilor prin `is_valid`.
+
+O soluție anterioară poate fi dată ca punct de plecare (warm start): după o
+modificare mică a constrângerilor, doar zona afectată mai are conflicte de reparat.
+"""
+
+import random
+from typing import Dict, List, Optional
+
+from app.telemetry import publish_search
+
+from .propagation import compile_problem
+
+
+def min_conflicts(variables, domains, constraints, initial: Optional[Dict[str, str]] = None,
+                  max_steps: int = 100_000, tabu_tenure: int = 10, walk_prob: float = 0.02,
+                  seed: Optional[int] = None, budget=None):
+    """
+    Întoarce (soluție sau None, statistici). None înseamnă doar că nu s-a găsit o
+    soluție în `max_steps` mutări – căutarea locală nu poate demonstra nesatisfiabilitatea.
+    """
+    rng = random.Random(seed)
+    csp = compile_problem(variables, domains, constraints)
+    n = len(csp.variables)
+    neighbours, orders = csp.neighbours, csp.orders
+    stats = {"moves": 0, "walks": 0, "conflicts": 0, "best_conflicts": 0}
+
+    if any(mask == 0 for mask in csp.domains):
+        return None, stats
+
+    value = [-1] * n
+    count: List[Dict[int, int]] = [{} for _ in range(n)]
+
+    def place(i: int, vid: int) -> None:
+        value[i] = vid
+        for j in neighbours[i]:
+            count[j][vid] = count[j].get(vid, 0) + 1
+
+    # pornire: valorile din soluția anterioară (dacă mai sunt în domeniu), restul greedy
+    value_ids = {val: vid for vid, val in enumerate(csp.values)}
+    pending = []
+    for i, var in enumerate(csp.variables):
+        vid = value_ids.get((initial or {}).get(var))
+        if vid is not None and csp.domains[i] >> vid & 1:
+            place(i, vid)
+        else:
+            pending.append(i)
+    for i in pending:
+        place(i, min(orders[i], key=lambda vid: (count[i].get(vid, 0), rng.random())))
+
+    # mulțimea variabilelor în conflict, cu extragere aleatoare în O(1)
+    conflicted: List[int] = []
+    position = [-1] * n
+
+    def refresh(i: int) -> None:
+        bad = count[i].get(value[i], 0) > 0
+        if bad and position[i] < 0:
+            position[i] = len(conflicted)
+            conflicted.append(i)
+        elif not bad and position[i] >= 0:
+            last = conflicted.pop()
+            if last != i:
+                conflicted[position[i]] = last
+                position[last] = position[i]
+            position[i] = -1
+
+    total = 0
+    for i in range(n):
+        total += count[i].get(value[i], 0)
+        refresh(i)
+    total //= 2                       # fiecare muchie în conflict a fost numărată de două ori
+    best_total = total
+    tabu: Dict[tuple, int] = {}       # (variabilă, valoare) -> pasul până la care e interzisă
+
+    for step in range(max_steps):
+        if not conflicted:
+            break
+        if budget is not None and budget.tick():
+            budget.partial = {csp.variables[i]: csp.values[value[i]] for i in range(n)}
+            break
+        x = conflicted[rng.randrange(len(conflicted))]
+        old = value[x]
+        order = orders[x]
+        if len(order) < 2:
+            continue
+
+        if rng.random() < walk_prob:
+            new = old
+            while new == old:
+                new = order[rng.randrange(len(order))]
+            stats["walks"] += 1
+        else:
+            cx = count[x]
+            best_cost, new, ties = None, None, 0
+            for vid in order:
+                cost = cx.get(vid, 0)
+                # aspirație: o mutare tabu e permisă dacă duce la cel mai bun total de până acum
+                if vid != old and tabu.get((x, vid), -1) >= step and total - cx.get(old, 0) + cost >= best_total:
+                    continue
+                if best_cost is None or cost < best_cost:
+                    best_cost, new, ties = cost, vid, 1
+                elif cost == best_cost:
+                    ties += 1
+                    if rng.randrange(ties) == 0:
+                        new = vid
+            if new == old:
+                continue
+
+        total += count[x].get(new, 0) - count[x].get(old, 0)
+        value[x] = new
+        for j in neighbours[x]:
+            cj = count[j]
+            left = cj[old] - 1
+            if left:
+                cj[old] = left
+            else:
+                del cj[old]
+            cj[new] = cj.get(new, 0) + 1
+            if value[j] == old or value[j] == new:
+                refresh(j)
+        refresh(x)
+        tabu[(x, old)] = step + tabu_tenure
+        stats["moves"] += 1
+        if total < best_total:
+            best_total = total
+
+    stats["conflicts"] = total
+    stats["best_conflicts"] = best_total
+    publish_search("local", {"nodes": stats["moves"]})
+    if conflicted:
+        return None, stats
+    return {csp.variables[i]: csp.values[value[i]] for i in range(n)}, stats
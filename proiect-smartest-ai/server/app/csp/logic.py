@@ -1,3 +1,10 @@
+from app.telemetry import publish_search
+
+from .heuristics import MRVState
+
+_EXHAUSTED = object()
+
+
 def is_valid(assignment, constraints):
     for (x, y) in constraints:
         if x in assignment and y in assignment:
@@ -5,25 +12,95 @@ def is_valid(assignment, constraints):
                 return False
     return True
 
-def backtracking(variables, domains, constraints, assignment={}, index=0, steps=0):
-    steps += 1
-
-    if index == len(variables):
-        return assignment, steps
-
-    var = variables[index]
-
-    for value in domains[var]:
-        assignment[var] = value
+def backtracking(variables, domains, constraints, assignment=None, index=0, steps=0, budget=None,
+                 stats=None):
+    """
+    Backtracking cronologic în ordinea fixă a variabilelor.
+
+    Căutarea folosește o stivă explicită de iteratori peste domenii (câte unul pe
+    nivel), deci nu mai depinde de limita de recursivitate Python.
+    Cu un `SearchBudget`, căutarea se poate opri înainte (vezi `budget.stopped`).
+    Un dict `stats` primește contoarele căutării (nodes, is_valid, backtracks).
+    """
+    return _drain(_backtracking_search(variables, domains, constraints, assignment, index, steps, budget,
+                                       stats=stats))
+
+
+def trace_backtracking(variables, domains, constraints, budget=None):
+    """
+    Aceeași căutare ca `backtracking`, dar ca generator de evenimente (dict-uri):
+    assign, check, backtrack și, la final, done cu soluția și numărul de pași.
+    Evenimentele se produc pe măsură ce căutarea avansează, deci memoria nu crește cu ele.
+    """
+    solution, steps = yield from _backtracking_search(variables, domains, constraints,
+                                                      budget=budget, trace=True)
+    yield {"event": "done", "solution": solution, "steps": steps}
+
+
+def _drain(search):
+    """Rulează un generator de căutare fără trace (nu produce nimic) și întoarce rezultatul lui."""
+    try:
+        while True:
+            next(search)
+    except StopIteration as stop:
+        return stop.value
+
+
+def _backtracking_search(variables, domains, constraints, assignment=None, index=0, steps=0,
+                         budget=None, trace=False, stats=None):
+    if assignment is None:
+        assignment = {}
 
-        if is_valid(assignment, constraints):
-            result, steps = backtracking(variables, domains, constraints, assignment, index + 1, steps)
-            if result:
-                return result, steps
+    steps += 1
+    # contoarele stau în variabile locale și se publică o dată, la final
+    calls = backtracks = 0
+    try:
+        if index == len(variables):
+            return assignment, steps
+
+        stack = [iter(domains[variables[index]])]
+        while stack:
+            depth = index + len(stack) - 1
+            var = variables[depth]
+            assignment.pop(var, None)
+
+            value = next(stack[-1], _EXHAUSTED)
+            if value is _EXHAUSTED:
+                stack.pop()
+                backtracks += 1
+                if trace:
+                    yield {"event": "backtrack", "var": var, "depth": depth}
+                continue
+
+            assignment[var] = value
+            if trace:
+                yield {"event": "assign", "var": var, "value": value, "depth": depth}
+            if budget is not None and budget.tick():
+                budget.partial = dict(assignment)
+                return None, steps
+
+            ok = is_valid(assignment, constraints)
+            calls += 1
+            if trace:
+                yield {"event": "check", "var": var, "value": value, "ok": ok}
+            if ok:
+                steps += 1
+                if depth + 1 == len(variables):
+                    return assignment, steps
+                stack.append(iter(domains[variables[depth + 1]]))
+
+        return None, steps
+    finally:
+        _publish("backtracking", stats, nodes=steps, is_valid=calls, backtracks=backtracks)
+
+
+def _publish(solver, stats, **counts):
+    """Copiază contoarele în `stats` (dacă apelantul le vrea) și le publică în metrici."""
+    if stats is not None:
+        stats.update(counts)
+    publish_search(solver, counts)
 
-        del assignment[var]
 
-    return None, steps
 def remaining_values(var, domains, assignment, constraints):
     """Câte valori mai sunt posibile pentru variabilă, ținând cont de ce e deja atribuit."""
     values = []
@@ -47,27 +124,95 @@ def select_unassigned_var_mrv(variables, domains, assignment, constraints):
             best_count = count
 
     return best_var
-def backtracking_mrv(variables, domains, constraints, assignment=None, steps=0):
-    if assignment is None:
-        assignment = {}
+def backtracking_mrv(variables, domains, constraints, assignment=None, steps=0,
+                     tie_break="none", value_order="static", budget=None, stats=None):
+    """
+    Backtracking cu MRV. Numărul de valori rămase e ținut incremental de `MRVState`,
+    deci alegerea variabilei nu mai copiază atribuirea și nu mai rescanează constrângerile.
+
+    tie_break: "none" | "degree" | "domwdeg" – departajare între variabile cu același MRV
+    value_order: "static" | "lcv" – ordinea în care se încearcă valorile
+    stats: dict opțional care primește contoarele căutării (nodes, backtracks)
+    """
+    return _drain(_mrv_search(variables, domains, constraints, assignment, steps,
+                              tie_break, value_order, budget, stats=stats))
+
+
+def trace_backtracking_mrv(variables, domains, constraints, tie_break="none",
+                           value_order="static", budget=None):
+    """
+    Căutarea MRV ca generator de evenimente. Pe lângă assign / check / backtrack
+    apar și evenimente prune: valoarea `value` a vecinului `var` e exclusă de
+    atribuirea lui `by`.
+    """
+    solution, steps = yield from _mrv_search(variables, domains, constraints, None, 0,
+                                             tie_break, value_order, budget, trace=True)
+    yield {"event": "done", "solution": solution, "steps": steps}
+
+
+def _pruned(state, var, vid):
+    """Vecinii lui `var` cărora atribuirea var=vid tocmai le-a scos valoarea vid din domeniu."""
+    csp = state.csp
+    bit = 1 << vid
+    return [j for j in csp.neighbours[var]
+            if state.value[j] < 0 and csp.domains[j] & bit and state.blocked[j][vid] == 1]
+
+
+def _mrv_search(variables, domains, constraints, assignment=None, steps=0,
+                tie_break="none", value_order="static", budget=None, trace=False, stats=None):
+    state = MRVState(variables, domains, constraints)
+    names, labels = state.csp.variables, state.csp.values
+    if assignment:
+        for var, value in assignment.items():
+            i = names.index(var)
+            state.assign(i, labels.index(value))
 
     steps += 1
-
-    # toate variabilele au fost atribuite
-    if len(assignment) == len(variables):
-        return assignment, steps
-
-    # alegem variabila după MRV, nu după index fix
-    var = select_unassigned_var_mrv(variables, domains, assignment, constraints)
-
-    for value in domains[var]:
-        assignment[var] = value
-
-        if is_valid(assignment, constraints):
-            result, steps = backtracking_mrv(variables, domains, constraints, assignment, steps)
-            if result:
-                return result, steps
-
-        del assignment[var]
-
-    return None, steps
+    backtracks = 0
+    try:
+        # toate variabilele au fost atribuite
+        if state.unassigned == 0:
+            return state.solution(), steps
+
+        # cadru: [variabilă, valori de încercat, poziția următoarei valori]
+        var = state.select(tie_break)
+        frames = [[var, state.ordered_values(var, value_order), 0]]
+        while frames:
+            frame = frames[-1]
+            var, values, pos = frame
+            if state.value[var] >= 0:
+                state.unassign(var)
+
+            if pos == len(values):
+                frames.pop()
+                backtracks += 1
+                if trace:
+                    yield {"event": "backtrack", "var": names[var], "depth": len(frames)}
+                continue
+            frame[2] = pos + 1
+            if budget is not None and budget.tick():
+                budget.partial = state.solution()
+                return None, steps
+
+            ok = state.assign(var, values[pos])
+            if trace:
+                yield {"event": "assign", "var": names[var], "value": labels[values[pos]], "depth": len(frames) - 1}
+                for j in _pruned(state, var, values[pos]):
+                    yield {"event": "prune", "var": names[j], "value": labels[values[pos]], "by": names[var]}
+                yield {"event": "check", "var": names[var], "value": labels[values[pos]], "ok": ok}
+            # ca în varianta recursivă, orice atribuire compatibilă cu vecinii atribuiți e un
+            # pas, chiar dacă golește domeniul unui vecin (acolo fundătura apărea un nivel mai jos)
+            steps += 1
+            if not ok:
+                continue
+
+            if state.unassigned == 0:
+                return state.solution(), steps
+
+            # alegem variabila după MRV, nu după index fix
+            nxt = state.select(tie_break)
+            frames.append([nxt, state.ordered_values(nxt, value_order), 0])
+
+        return None, steps
+    finally:
+        _publish("backtracking_mrv", stats, nodes=steps, backtracks=backtracks)
@@ -1,12 +1,53 @@
-from pydantic import BaseModel
-from typing import Dict, List
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional, Union
+
+class TypedConstraint(BaseModel):
+    type: Literal["neq", "alldiff"]
+    variables: List[str]  # "neq": exact 2 variabile; "alldiff": oricâte
 
 class CSPProblem(BaseModel):
     variables: List[str]
     domains: Dict[str, List[str]]
-    constraints: List[List[str]]  # ex: [["X1", "X2"], ["X2", "X3"]]
+    # ex: [["X1", "X2"], {"type": "alldiff", "variables": ["X1", "X2", "X3"]}]
+    constraints: List[Union[List[str], TypedConstraint]]
+
+class LocalSearchRequest(CSPProblem):
+    warm_start: Optional[Dict[str, str]] = None  # soluție anterioară de reparat
+    max_steps: int = 100_000
+    seed: Optional[int] = None
 
 class CSPSolution(BaseModel):
     solution: Dict[str, str]
     steps: int
     message: str
+    stats: Optional[Dict[str, int]] = None  # contoare de căutare (noduri, verificări, tăieri...)
+
+class WorkerReport(BaseModel):
+    config: str
+    status: str  # "solved" | "unsat" | "not_found" | "time" | "cancelled"
+    time_ms: float
+    stats: Dict[str, Any]
+
+class PortfolioSolution(CSPSolution):
+    winner: Optional[str] = None
+    workers: List[WorkerReport] = []
+
+class JobRequest(CSPProblem):
+    solver: str = "ac3"                 # vezi app/csp/registry.py
+    # bugetele sunt plafonate pe server: un job nu poate ține un worker din pool oricât
+    max_nodes: Optional[int] = Field(None, ge=1, le=50_000_000)
+    time_limit: Optional[float] = Field(None, gt=0, le=300)  # secunde; implicit 60
+
+class JobResult(BaseModel):
+    outcome: str  # "solved" | "unsat" | "not_found" | "nodes" | "time" | "cancelled"
+    solution: Optional[Dict[str, str]] = None
+    partial: Optional[Dict[str, str]] = None
+    stats: Dict[str, Any]
+    time_ms: float
+
+class JobStatus(BaseModel):
+    job_id: str
+    solver: str
+    status: str  # "queued" | "running" | "done" | "cancelled" | "failed"
+    result: Optional[JobResult] = None
+    error: Optional[str] = None
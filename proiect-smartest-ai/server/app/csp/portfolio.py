@@ -0,0 +1,96 @@
+"""
+Portofoliu de solveri rulați în paralel, în procese separate.
+
+Nu știm dinainte ce euristică merge pe o instanță, așa că pornim mai multe
+configurații din `SOLVERS` în pool-ul comun de procese (`workers.solver_pool`) și
+păstrăm primul răspuns definitiv: o soluție sau o demonstrație de nesatisfiabilitate
+de la un solver complet. Ceilalți workeri sunt opriți prin slotul de anulare al
+cererii, verificat de bugetul de căutare al fiecăruia, și își raportează statisticile.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Dict, List, Optional
+
+from app.telemetry import capture_searches, replay
+
+from .budget import SearchBudget
+from .registry import SOLVERS
+from .workers import SlotFlag, solver_pool
+
+DEFAULT_PORTFOLIO = [
+    "ac3", "mrv_domwdeg", "cbj", "cbj_seed1", "cbj_seed2", "local", "backtracking_mrv", "backtracking",
+]
+DEFAULT_TIME_LIMIT = 30.0   # secunde, dacă cererea nu cere altceva
+MAX_TIME_LIMIT = 60.0       # plafon: o cerere ține workerii pool-ului comun cel mult atât
+CANCEL_GRACE = 2.0          # cât mai așteptăm workerii după limita de timp sau după anulare
+
+
+def _run_config(slot: int, name: str, variables, domains, constraints, time_limit: float) -> Dict:
+    config = SOLVERS[name]
+    budget = SearchBudget(time_limit=time_limit, cancel_event=SlotFlag(slot))
+    start = time.perf_counter()
+    with capture_searches() as published:
+        solution, stats = config.run(variables, domains, constraints, budget=budget)
+    if solution is not None:
+        status = "solved"
+    elif budget.stopped:
+        status = budget.stopped
+    else:
+        status = "unsat" if config.complete else "not_found"
+    return {
+        "config": name,
+        "status": status,
+        "solution": solution,
+        "stats": stats,
+        "time_ms": round(1000 * (time.perf_counter() - start), 3),
+        "published": published,
+    }
+
+
+def solve_portfolio(variables, domains, constraints, configs: Optional[List[str]] = None,
+                    time_limit: float = DEFAULT_TIME_LIMIT):
+    """
+    Întoarce (raportul câștigătorului sau None, rapoartele tuturor workerilor).
+
+    Câștigătorul are statusul "solved" sau "unsat"; None înseamnă că nicio
+    configurație n-a dat un răspuns definitiv în `time_limit` secunde (cel mult
+    `MAX_TIME_LIMIT`). Configurațiile care n-au apucat să pornească sau nu s-au
+    oprit la timp apar ca "cancelled".
+    """
+    names = [name for name in (configs or DEFAULT_PORTFOLIO) if name in SOLVERS]
+    if not names:
+        raise ValueError("Nicio configurație de solver cunoscută.")
+
+    winner = None
+    reports: List[Dict] = []
+    time_limit = min(time_limit, MAX_TIME_LIMIT)
+    deadline = time.monotonic() + time_limit + CANCEL_GRACE
+    with solver_pool.batch() as batch:
+        pending = {batch.submit(_run_config, name, variables, domains, constraints, time_limit): name
+                   for name in names}
+        while pending and winner is None:
+            done, _ = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                del pending[future]
+                report = future.result()
+                reports.append(report)
+                if winner is None and report["status"] in ("solved", "unsat"):
+                    winner = report
+
+        # oprim restul: cele din coadă sunt anulate, cele pornite văd flag-ul și raportează
+        batch.cancel()
+        done, _ = wait(pending, timeout=CANCEL_GRACE)
+        for future, name in pending.items():
+            if future in done and not future.cancelled():
+                reports.append(future.result())
+            else:
+                reports.append({"config": name, "status": "cancelled", "solution": None,
+                                "stats": {}, "time_ms": 0.0, "published": []})
+    # workerii sunt alte procese: contoarele lor ajung în metrici doar prin rapoarte
+    for report in reports:
+        replay(report.pop("published"))
+    return winner, reports
@@ -0,0 +1,388 @@
+"""
+Motor de căutare cu propagare pentru CSP-uri cu constrângeri de inegalitate
+(perechi și alldiff).
+
+Problema se compilează o singură dată:
+  - variabilele primesc indici întregi;
+  - valorile sunt internate global, iar fiecare domeniu devine un bitset (int);
+  - pentru fiecare variabilă se precalculează lista vecinilor din graful de constrângeri.
+
+După compilare, o atribuire costă O(grad) în loc de O(|C|) (nu mai scanăm lista
+de constrângeri ca `is_valid`), iar domeniile sunt tăiate prin forward checking
+sau prin arc-consistență (AC-3) menținută la fiecare nod. În modul AC-3,
+constrângerile alldiff rămân globale și sunt filtrate cu algoritmul lui Régin.
+"""
+
+from itertools import combinations
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.telemetry import publish_search
+
+from .alldiff import filter_alldiff
+from .constraints import split_constraints
+
+
+class CompiledCSP:
+    """Forma indexată a unei probleme CSP, construită o singură dată per cerere."""
+
+    __slots__ = ("variables", "values", "orders", "domains", "neighbours", "alldiffs", "groups_of")
+
+    def __init__(self, variables, values, orders, domains, neighbours, alldiffs=(), groups_of=None):
+        self.variables: List[str] = variables      # indice -> nume variabilă
+        self.values: List[str] = values            # id valoare -> valoare
+        self.orders: List[Tuple[int, ...]] = orders  # ordinea valorilor din domeniu, per variabilă
+        self.domains: List[int] = domains          # bitset-ul inițial al fiecărui domeniu
+        self.neighbours: List[Tuple[int, ...]] = neighbours
+        self.alldiffs: List[Tuple[int, ...]] = list(alldiffs)  # grupuri alldiff păstrate globale
+        self.groups_of: List[Tuple[int, ...]] = groups_of or [() for _ in variables]
+
+
+def compile_problem(variables, domains, constraints, expand_alldiff=True) -> CompiledCSP:
+    """
+    Construiește indexul de vecini și domeniile codificate ca bitset-uri.
+
+    Constrângerile care pomenesc variabile necunoscute sunt ignorate (la fel ca în
+    `is_valid`, unde nu ajung niciodată să fie verificate). O constrângere (X, X)
+    golește domeniul lui X.
+
+    Cu `expand_alldiff=True`, fiecare alldiff devine vecinătăți pereche cu pereche
+    (pentru solverii care știu doar de inegalități); altfel grupul se păstrează în
+    `alldiffs` și e propagat global în modul AC-3.
+    """
+    index = {v: i for i, v in enumerate(variables)}
+    value_ids: Dict[str, int] = {}
+    values: List[str] = []
+    orders: List[Tuple[int, ...]] = []
+    masks: List[int] = []
+
+    for var in variables:
+        order: List[int] = []
+        mask = 0
+        for val in domains.get(var, []):
+            vid = value_ids.get(val)
+            if vid is None:
+                vid = len(values)
+                value_ids[val] = vid
+                values.append(val)
+            bit = 1 << vid
+            if not mask & bit:
+                mask |= bit
+                order.append(vid)
+        orders.append(tuple(order))
+        masks.append(mask)
+
+    pairs, groups = split_constraints(constraints)
+    alldiffs: List[Tuple[int, ...]] = []
+    for scope in groups:
+        members = [index[v] for v in scope if v in index]
+        if len(set(members)) < len(members):
+            for i in {i for i in members if members.count(i) > 1}:
+                masks[i] = 0
+            members = list(dict.fromkeys(members))
+        if expand_alldiff:
+            pairs.extend([x, y] for x, y in combinations([variables[i] for i in members], 2))
+        elif len(members) > 1:
+            alldiffs.append(tuple(members))
+
+    adjacency = [set() for _ in variables]
+    for pair in pairs:
+        i, j = index.get(pair[0]), index.get(pair[1])
+        if i is None or j is None:
+            continue
+        if i == j:
+            masks[i] = 0
+            continue
+        adjacency[i].add(j)
+        adjacency[j].add(i)
+
+    groups_of: List[List[int]] = [[] for _ in variables]
+    for g, members in enumerate(alldiffs):
+        for i in members:
+            groups_of[i].append(g)
+
+    neighbours = [tuple(sorted(adj)) for adj in adjacency]
+    return CompiledCSP(list(variables), values, orders, masks, neighbours,
+                       alldiffs, [tuple(gs) for gs in groups_of])
+
+
+def compile_indexed(variables, values, domain_offsets, domain_values, edges,
+                    alldiff_offsets=(), alldiff_members=()) -> CompiledCSP:
+    """
+    Variantă a `compile_problem` pentru problema deja indexată (vezi app/csp/wire.py).
+
+    Domeniile vin în format CSR: valorile variabilei i sunt
+    domain_values[domain_offsets[i]:domain_offsets[i + 1]]; fără offset-uri,
+    `domain_values` este domeniul comun al tuturor variabilelor. `edges` este plat
+    (i0, j0, i1, j1, ...), iar grupurile alldiff sunt tot CSR și rămân globale.
+    Ridică ValueError pentru indici în afara limitelor.
+    """
+    n, k = len(variables), len(values)
+
+    def check(index: int, limit: int, what: str) -> int:
+        if not 0 <= index < limit:
+            raise ValueError(f"Indice de {what} în afara limitelor: {index}")
+        return index
+
+    orders: List[Tuple[int, ...]] = []
+    masks: List[int] = []
+    if len(domain_offsets):
+        if len(domain_offsets) != n + 1:
+            raise ValueError("domain_offsets trebuie să aibă n + 1 elemente.")
+        spans = [(domain_offsets[i], domain_offsets[i + 1]) for i in range(n)]
+    else:
+        spans = [(0, len(domain_values))] * n
+    shared = None
+    for start, end in spans:
+        if shared is not None and (start, end) == shared[0]:
+            orders.append(shared[1])
+            masks.append(shared[2])
+            continue
+        if not 0 <= start <= end <= len(domain_values):
+            raise ValueError("domain_offsets invalide.")
+        order: List[int] = []
+        mask = 0
+        for vid in domain_values[start:end]:
+            bit = 1 << check(vid, k, "valoare")
+            if not mask & bit:
+                mask |= bit
+                order.append(vid)
+        shared = ((start, end), tuple(order), mask)
+        orders.append(shared[1])
+        masks.append(mask)
+
+    if len(edges) % 2:
+        raise ValueError("edges trebuie să aibă un număr par de elemente.")
+    adjacency = [set() for _ in range(n)]
+    it = iter(edges)
+    for i, j in zip(it, it):
+        check(i, n, "variabilă")
+        check(j, n, "variabilă")
+        if i == j:
+            masks[i] = 0
+            continue
+        adjacency[i].add(j)
+        adjacency[j].add(i)
+
+    alldiffs: List[Tuple[int, ...]] = []
+    if len(alldiff_offsets):
+        for g in range(len(alldiff_offsets) - 1):
+            start, end = alldiff_offsets[g], alldiff_offsets[g + 1]
+            if not 0 <= start <= end <= len(alldiff_members):
+                raise ValueError("alldiff_offsets invalide.")
+            members = [check(i, n, "variabilă") for i in alldiff_members[start:end]]
+            if len(set(members)) < len(members):
+                for i in {i for i in members if members.count(i) > 1}:
+                    masks[i] = 0
+                members = list(dict.fromkeys(members))
+            if len(members) > 1:
+                alldiffs.append(tuple(members))
+
+    groups_of: List[List[int]] = [[] for _ in range(n)]
+    for g, members in enumerate(alldiffs):
+        for i in members:
+            groups_of[i].append(g)
+
+    neighbours = [tuple(sorted(adj)) for adj in adjacency]
+    return CompiledCSP(list(variables), list(values), orders, masks, neighbours,
+                       alldiffs, [tuple(gs) for gs in groups_of])
+
+
+def new_stats() -> Dict[str, int]:
+    return {"nodes": 0, "checks": 0, "prunes": 0, "backtracks": 0}
+
+
+# -------------------------------------------------
+# Propagatoare
+# -------------------------------------------------
+
+def _forward_check(csp, dom, trail, var, stats) -> bool:
+    """Scoate valoarea lui `var` din domeniile vecinilor. False la domeniu gol."""
+    bit = dom[var]
+    for j in csp.neighbours[var]:
+        stats["checks"] += 1
+        mask = dom[j]
+        if mask & bit:
+            trail.append((j, mask))
+            mask &= ~bit
+            dom[j] = mask
+            stats["prunes"] += 1
+            if not mask:
+                return False
+    return True
+
+
+def _arc_consistency(csp, dom, trail, queue, stats) -> bool:
+    """
+    AC-3 specializat pentru constrângeri de inegalitate.
+
+    Pentru X != Y, arcul (X, Y) poate tăia ceva din X doar când domeniul lui Y
+    a devenit singleton; suportul unei valori a din X este orice b != a din Y,
+    deci verificarea de suport (reziduul din AC-2001) e o simplă operație pe bitset.
+    Coada conține așadar doar variabilele care au ajuns la o singură valoare.
+    """
+    neighbours = csp.neighbours
+    while queue:
+        var = queue.pop()
+        bit = dom[var]
+        for j in neighbours[var]:
+            stats["checks"] += 1
+            mask = dom[j]
+            if mask & bit:
+                trail.append((j, mask))
+                mask &= ~bit
+                dom[j] = mask
+                stats["prunes"] += 1
+                if not mask:
+                    queue.clear()
+                    return False
+                if not mask & (mask - 1):
+                    queue.append(j)
+    return True
+
+
+def _propagate(csp, dom, trail, queue, stats, touched) -> bool:
+    """
+    Punct fix între AC-3 pe perechi și filtrarea Régin pe grupurile alldiff
+    atinse de variabilele din `touched` sau de orice domeniu modificat pe parcurs.
+    """
+    start = len(trail)
+    touched = set(touched)
+    while True:
+        if not _arc_consistency(csp, dom, trail, queue, stats):
+            return False
+        if not csp.alldiffs:
+            return True
+        touched.update(j for j, _ in trail[start:])
+        start = len(trail)
+        groups = {g for i in touched for g in csp.groups_of[i]}
+        touched.clear()
+        if not groups:
+            return True
+        for g in groups:
+            ok, changed = filter_alldiff(csp.alldiffs[g], dom, trail, stats)
+            if not ok:
+                return False
+            queue.extend(j for j in changed if not dom[j] & (dom[j] - 1))
+        if len(trail) == start:
+            return True
+
+
+# -------------------------------------------------
+# Căutare
+# -------------------------------------------------
+
+def _select_var(csp, dom, assigned) -> Optional[int]:
+    """Variabila neatribuită cu domeniul curent minim (egalitate -> grad maxim)."""
+    best = None
+    best_key = None
+    for i, mask in enumerate(dom):
+        if assigned[i] >= 0:
+            continue
+        key = (mask.bit_count(), -len(csp.neighbours[i]))
+        if best_key is None or key < best_key:
+            best, best_key = i, key
+            if key[0] <= 1:
+                break
+    return best
+
+
+def iter_solutions(csp: CompiledCSP, mode: str = "ac3", stats=None, budget=None,
+                   indexed: bool = False) -> Iterator[Dict[str, str]]:
+    """
+    Generează soluțiile problemei compilate, una câte una.
+
+    Căutarea e iterativă (stivă explicită + trail de domenii), deci adâncimea nu e
+    limitată de recursivitatea Python. `mode` este "fc" sau "ac3"; grupurile
+    alldiff neexpandate sunt propagate doar în modul "ac3". Dacă `budget` se
+    termină, generatorul se oprește și lasă atribuirea parțială în `budget.partial`.
+    Cu `indexed=True`, o soluție este lista id-urilor de valori, per variabilă.
+    La închiderea generatorului, statisticile se publică în metrici sub numele `mode`.
+    """
+    if stats is None:
+        stats = new_stats()
+    try:
+        yield from _search(csp, mode, stats, budget, indexed)
+    finally:
+        publish_search(mode, stats)
+
+
+def _search(csp: CompiledCSP, mode: str, stats, budget, indexed: bool):
+    n = len(csp.variables)
+    dom = list(csp.domains)
+    assigned = [-1] * n
+    trail: List[Tuple[int, int]] = []
+    use_ac3 = mode == "ac3"
+
+    if any(mask == 0 for mask in dom):
+        return
+    if use_ac3:
+        queue = [i for i, mask in enumerate(dom) if not mask & (mask - 1)]
+        if not _propagate(csp, dom, trail, queue, stats, touched=range(n)):
+            return
+        trail.clear()
+
+    var = _select_var(csp, dom, assigned)
+    if var is None:
+        yield [] if indexed else {}
+        return
+
+    # cadru: [variabilă, poziția următoarei valori din ordinea domeniului, lungimea trail-ului]
+    frames = [[var, 0, 0]]
+    while frames:
+        frame = frames[-1]
+        var, pos, mark = frame
+        while len(trail) > mark:
+            j, mask = trail.pop()
+            dom[j] = mask
+        assigned[var] = -1
+
+        order = csp.orders[var]
+        mask = dom[var]
+        while pos < len(order) and not mask & (1 << order[pos]):
+            pos += 1
+        if pos == len(order):
+            frames.pop()
+            stats["backtracks"] += 1
+            continue
+        frame[1] = pos + 1
+
+        if budget is not None and budget.tick():
+            budget.partial = {csp.variables[i]: csp.values[v] for i, v in enumerate(assigned) if v >= 0}
+            return
+        vid = order[pos]
+        stats["nodes"] += 1
+        assigned[var] = vid
+        trail.append((var, mask))
+        dom[var] = 1 << vid
+
+        if use_ac3:
+            ok = _propagate(csp, dom, trail, [var], stats, touched=[var])
+        else:
+            ok = _forward_check(csp, dom, trail, var, stats)
+        if not ok:
+            continue
+
+        nxt = _select_var(csp, dom, assigned)
+        if nxt is None:
+            yield list(assigned) if indexed else {csp.variables[i]: csp.values[assigned[i]] for i in range(n)}
+            continue
+        frames.append([nxt, 0, len(trail)])
+
+
+def backtracking_fc(variables, domains, constraints, budget=None):
+    """Backtracking cu forward checking. Întoarce (soluție sau None, statistici)."""
+    stats = new_stats()
+    csp = compile_problem(variables, domains, constraints)
+    solution = next(iter_solutions(csp, "fc", stats, budget), None)
+    return solution, stats
+
+
+def backtracking_ac3(variables, domains, constraints, budget=None):
+    """
+    Backtracking cu arc-consistență menținută (AC-3) și filtrare Régin pentru alldiff.
+    Întoarce (soluție sau None, statistici).
+    """
+    stats = new_stats()
+    csp = compile_problem(variables, domains, constraints, expand_alldiff=False)
+    solution = next(iter_solutions(csp, "ac3", stats, budget), None)
+    return solution, stats
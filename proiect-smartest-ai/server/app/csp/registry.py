@@ -0,0 +1,58 @@
+"""
+Registrul configurațiilor de solver, adresabile după nume.
+
+Fiecare intrare are aceeași semnătură, `run(variables, domains, constraints, budget)
+-> (soluție | None, statistici)`, plus un indicator dacă solverul este complet
+(un None de la un solver complet, fără buget epuizat, înseamnă „nu există soluție”).
+Numele se pot trimite între procese, spre deosebire de funcțiile construite aici.
+"""
+
+from functools import partial
+from typing import Callable, Dict, NamedTuple
+
+from .constraints import expand_constraints
+from .decomposition import solve_by_components
+from .local_search import min_conflicts
+from .logic import backtracking, backtracking_mrv
+from .propagation import backtracking_ac3, backtracking_fc
+from .search import backtracking_cbj
+
+
+class SolverConfig(NamedTuple):
+    run: Callable
+    complete: bool
+
+
+def _legacy(solver, **options):
+    def run(variables, domains, constraints, budget=None):
+        stats: Dict[str, int] = {}
+        solution, _ = solver(variables, domains, expand_constraints(constraints),
+                             budget=budget, stats=stats, **options)
+        return solution, stats
+    return run
+
+
+def _by_components(solver, **options):
+    def run(variables, domains, constraints, budget=None):
+        return solve_by_components(variables, domains, constraints, partial(solver, **options), budget=budget)
+    return run
+
+
+def _local(seed):
+    def run(variables, domains, constraints, budget=None):
+        return min_conflicts(variables, domains, constraints, seed=seed, budget=budget)
+    return run
+
+
+SOLVERS: Dict[str, SolverConfig] = {
+    "backtracking": SolverConfig(_legacy(backtracking), True),
+    "backtracking_mrv": SolverConfig(_legacy(backtracking_mrv), True),
+    "mrv_domwdeg": SolverConfig(_legacy(backtracking_mrv, tie_break="domwdeg", value_order="lcv"), True),
+    "fc": SolverConfig(_by_components(backtracking_fc), True),
+    "ac3": SolverConfig(_by_components(backtracking_ac3), True),
+    "cbj": SolverConfig(_by_components(backtracking_cbj, seed=0), True),
+    "cbj_seed1": SolverConfig(_by_components(backtracking_cbj, seed=1), True),
+    "cbj_seed2": SolverConfig(_by_components(backtracking_cbj, seed=2), True),
+    "local": SolverConfig(_local(0), False),
+    "local_seed1": SolverConfig(_local(1), False),
+}
@@ -0,0 +1,217 @@
+"""
+Căutare nerecursivă cu backjumping dirijat de conflicte (FC-CBJ), învățare de
+nogood-uri și restart-uri randomizate după secvența Luby.
+
+La fiecare fundătură, mulțimea de conflict a variabilei spune exact care
+atribuiri trecute au cauzat-o; sărim direct la cea mai adâncă dintre ele în loc
+să revenim cronologic, iar atribuirea vinovată se memorează ca nogood.
+Nogood-urile sunt consecințe ale constrângerilor, deci rămân valide și după restart.
+"""
+
+import random
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+from app.telemetry import publish_search
+
+from .propagation import CompiledCSP, compile_problem
+
+Lit = Tuple[int, int]          # (variabilă, id valoare)
+Nogood = FrozenSet[Lit]
+
+RESTART = "restart"
+UNSAT = "unsat"
+
+
+def luby(i: int) -> int:
+    """Al i-lea termen (i >= 1) al secvenței Luby: 1 1 2 1 1 2 4 1 1 2 ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    while i != (1 << k) - 1:
+        i -= (1 << (k - 1)) - 1
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+    return 1 << (k - 1)
+
+
+class NogoodStore:
+    """Nogood-uri memorate cu limită de capacitate; la depășire se scot cele mai vechi nefolosite (LRU)."""
+
+    def __init__(self, capacity: int = 1000, max_size: int = 32):
+        self.capacity = capacity
+        self.max_size = max_size
+        self._items: "OrderedDict[Nogood, None]" = OrderedDict()
+        self._watch: Dict[Lit, Set[Nogood]] = {}
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, nogood: Nogood) -> None:
+        if not nogood or len(nogood) > self.max_size or nogood in self._items:
+            return
+        self._items[nogood] = None
+        for lit in nogood:
+            self._watch.setdefault(lit, set()).add(nogood)
+        while len(self._items) > self.capacity:
+            old, _ = self._items.popitem(last=False)
+            self.evicted += 1
+            for lit in old:
+                watched = self._watch[lit]
+                watched.discard(old)
+                if not watched:
+                    del self._watch[lit]
+
+    def violated(self, var: int, vid: int, assigned: List[int]) -> Optional[Nogood]:
+        """Primul nogood care conține (var, vid) și are toți literalii adevărați."""
+        for nogood in self._watch.get((var, vid), ()):
+            if all(assigned[u] == w for (u, w) in nogood):
+                self._items.move_to_end(nogood)
+                return nogood
+        return None
+
+
+STOPPED = "stopped"
+
+
+def _run(csp: CompiledCSP, nogoods: NogoodStore, rng: Optional[random.Random],
+         conflict_limit: Optional[int], stats: Dict[str, int], budget=None):
+    """
+    O rulare FC-CBJ până la soluție, demonstrarea nesatisfiabilității sau
+    depășirea limitei de conflicte. Întoarce (soluție | UNSAT | RESTART | STOPPED).
+    """
+    n = len(csp.variables)
+    neighbours, orders = csp.neighbours, csp.orders
+    dom = list(csp.domains)
+    if any(mask == 0 for mask in dom):
+        return UNSAT
+
+    assigned = [-1] * n
+    depth = [-1] * n
+    past_fc: List[List[int]] = [[] for _ in range(n)]   # cine a tăiat din domeniul fiecărei variabile
+    trail: List[Tuple[int, int, int]] = []              # (variabilă, domeniu vechi, cine a tăiat / -1)
+    run_conflicts = 0
+
+    def select() -> Optional[int]:
+        best, best_key = None, None
+        for i in range(n):
+            if assigned[i] >= 0:
+                continue
+            key = (dom[i].bit_count(), -len(neighbours[i]), rng.random() if rng else i)
+            if best_key is None or key < best_key:
+                best, best_key = i, key
+        return best
+
+    def pick(var: int, cand: int) -> int:
+        values = [vid for vid in orders[var] if cand >> vid & 1]
+        return rng.choice(values) if rng else values[0]
+
+    var = select()
+    if var is None:
+        return {}
+    # cadru: [variabilă, valori neîncercate (bitset), mulțime de conflict, lungimea trail-ului]
+    frames: List[list] = [[var, dom[var], set(), 0]]
+
+    while frames:
+        frame = frames[-1]
+        var, cand, conf, mark = frame
+        while len(trail) > mark:
+            j, mask, pruner = trail.pop()
+            dom[j] = mask
+            if pruner >= 0:
+                past_fc[j].pop()
+        assigned[var] = -1
+
+        if not cand:
+            # fundătură: sărim la cea mai adâncă atribuire vinovată
+            culprits = conf.union(past_fc[var])
+            culprits.discard(var)
+            if not culprits:
+                return UNSAT
+            nogoods.add(frozenset((u, assigned[u]) for u in culprits))
+            target = max(culprits, key=depth.__getitem__)
+            popped = 0
+            while frames[-1][0] != target:
+                assigned[frames.pop()[0]] = -1
+                popped += 1
+            if popped > 1:
+                stats["backjumps"] += 1
+            frames[-1][2].update(culprits)
+            frames[-1][2].discard(target)
+            continue
+
+        if budget is not None and budget.tick():
+            budget.partial = {csp.variables[i]: csp.values[v] for i, v in enumerate(assigned) if v >= 0}
+            return STOPPED
+        vid = pick(var, cand)
+        bit = 1 << vid
+        frame[1] = cand & ~bit
+        stats["nodes"] += 1
+        assigned[var] = vid
+        depth[var] = len(frames) - 1
+        trail.append((var, dom[var], -1))
+        dom[var] = bit
+
+        nogood = nogoods.violated(var, vid, assigned)
+        failed = nogood is not None
+        if failed:
+            conf.update(u for (u, _) in nogood if u != var)
+        else:
+            for j in neighbours[var]:
+                if assigned[j] >= 0:
+                    continue
+                stats["checks"] += 1
+                mask = dom[j]
+                if mask & bit:
+                    trail.append((j, mask, var))
+                    past_fc[j].append(var)
+                    dom[j] = mask & ~bit
+                    stats["prunes"] += 1
+                    if not dom[j]:
+                        conf.update(u for u in past_fc[j] if u != var)
+                        failed = True
+                        break
+        if failed:
+            stats["conflicts"] += 1
+            run_conflicts += 1
+            if conflict_limit is not None and run_conflicts >= conflict_limit:
+                return RESTART
+            continue
+
+        nxt = select()
+        if nxt is None:
+            return {csp.variables[i]: csp.values[assigned[i]] for i in range(n)}
+        frames.append([nxt, dom[nxt], set(), len(trail)])
+
+    return UNSAT
+
+
+def backtracking_cbj(variables, domains, constraints, restarts=True, seed=0,
+                     restart_base=100, nogood_capacity=1000, budget=None):
+    """
+    FC-CBJ cu nogood-uri și (opțional) restart-uri Luby.
+
+    Prima rulare e deterministă; după fiecare restart departajările dintre
+    variabile și ordinea valorilor sunt randomizate cu `seed`.
+    Întoarce (soluție sau None, statistici).
+    """
+    stats = {"nodes": 0, "conflicts": 0, "backjumps": 0, "checks": 0, "prunes": 0,
+             "restarts": 0, "nogoods": 0}
+    csp = compile_problem(variables, domains, constraints)
+    store = NogoodStore(capacity=nogood_capacity)
+    rng = None
+    run = 1
+    while True:
+        limit = restart_base * luby(run) if restarts else None
+        outcome = _run(csp, store, rng, limit, stats, budget)
+        if outcome != RESTART:
+            break
+        stats["restarts"] += 1
+        run += 1
+        if rng is None:
+            rng = random.Random(seed)
+    stats["nogoods"] = len(store)
+    publish_search("cbj", stats)
+    return (None if outcome in (UNSAT, STOPPED) else outcome), stats
@@ -0,0 +1,61 @@
+"""
+Limitarea fluxului de evenimente de trace trimis clientului.
+
+Evenimentele vin direct din generatorul căutării, deci nu sunt adunate nicăieri:
+păstrăm doar unul din `sample`, cel mult `max_rate` pe secundă și cel mult
+`max_events` în total. La depășirea limitei totale căutarea se oprește
+(generatorul e închis), iar clientul primește un eveniment "truncated".
+Evenimentul final "done" trece mereu de eșantionare.
+
+`throttle` e un generator async: căutarea avansează în threadpool, câte un lot
+de evenimente odată, iar pauzele pentru `max_rate` sunt `asyncio.sleep`, deci un
+client lent nu ține ocupat un thread din pool cât așteaptă.
+"""
+
+import asyncio
+import time
+from itertools import islice
+from typing import AsyncIterator, Dict, Iterator, List, Optional
+
+from fastapi.concurrency import run_in_threadpool
+
+BATCH = 256   # evenimente scoase din căutare la o trecere prin threadpool
+
+
+def _take(events: Iterator[Dict], count: int) -> List[Dict]:
+    return list(islice(events, count))
+
+
+async def throttle(events: Iterator[Dict], sample: int = 1, max_rate: Optional[float] = None,
+                   max_events: Optional[int] = None) -> AsyncIterator[Dict]:
+    interval = 1.0 / max_rate if max_rate else 0.0
+    next_at = time.monotonic()
+    sent = 0
+    seq = 0
+    try:
+        while True:
+            batch = await run_in_threadpool(_take, events, BATCH)
+            if not batch:
+                return
+            for event in batch:
+                if event["event"] != "done":
+                    if seq % sample:
+                        seq += 1
+                        continue
+                    if max_events is not None and sent >= max_events:
+                        yield {"event": "truncated", "seq": seq, "sent": sent}
+                        return
+                if interval:
+                    delay = next_at - time.monotonic()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    next_at = max(next_at, time.monotonic()) + interval
+                event["seq"] = seq
+                seq += 1
+                sent += 1
+                yield event
+    finally:
+        # run_in_threadpool nu abandonează thread-ul la anulare, deci generatorul nu mai rulează aici
+        close = getattr(events, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,81 @@
+"""
+Formatul compact al unei probleme CSP (vezi și app/wire.py).
+
+JSON / msgpack:
+    {
+      "variables": ["X1", "X2", "X3"],        # etichete, o singură dată
+      "values": ["roșu", "verde"],            # etichete de valori internate
+      "domain_offsets": [0, 2, 4, 6],         # CSR; lipsă => domeniu comun
+      "domain_values": [0, 1, 0, 1, 0, 1],
+      "edges": [0, 1, 1, 2],                  # perechi X_i != X_j, plat
+      "alldiff_offsets": [0, 3],              # opțional, CSR
+      "alldiff_members": [0, 1, 2]
+    }
+
+Binar (little-endian): b"CSP1", apoi 8 × uint32
+    n_variables, n_values, labels_bytes,
+    n_domain_offsets, n_domain_values, n_edges, n_alldiff_offsets, n_alldiff_members
+urmate de etichete (UTF-8, separate prin octetul 0: întâi variabilele, apoi
+valorile), completate cu zero până la multiplu de 4, apoi tablourile int32 în
+ordinea de mai sus.
+
+Răspunsul are aceeași codificare ca cererea: în JSON / msgpack
+{"status", "assignment": [id valoare per variabilă] | null, "stats"}; în binar,
+tabloul int32 al atribuirii (gol dacă nu există soluție), cu statusul în antetul
+X-CSP-Status.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from app.wire import BINARY, dump_document, int_buffer, int_field, load_document, pack_ints, read_header, read_labels
+
+from .propagation import CompiledCSP, compile_indexed
+
+MAGIC = b"CSP1"
+_FIELDS = ("domain_offsets", "domain_values", "edges", "alldiff_offsets", "alldiff_members")
+
+
+def decode_problem(body: bytes, kind: str) -> CompiledCSP:
+    """Decodează corpul cererii direct în forma compilată; ValueError dacă e invalid."""
+    if kind == BINARY:
+        return _decode_binary(body)
+    doc = load_document(body, kind)
+    variables, values = doc.get("variables"), doc.get("values")
+    if not isinstance(variables, list) or not isinstance(values, list):
+        raise ValueError("Câmpurile 'variables' și 'values' trebuie să fie liste.")
+    arrays = {name: int_field(doc, name, default=[] if name != "domain_values" else None)
+              for name in _FIELDS}
+    return compile_indexed([str(v) for v in variables], [str(v) for v in values], **arrays)
+
+
+def _decode_binary(body: bytes) -> CompiledCSP:
+    n_vars, n_values, labels_bytes, *counts = read_header(body, MAGIC, 3 + len(_FIELDS))
+    offset = len(MAGIC) + 4 * (3 + len(_FIELDS))
+    labels = read_labels(body, offset, labels_bytes, n_vars + n_values)
+    offset += (labels_bytes + 3) // 4 * 4
+    arrays = {}
+    for name, count in zip(_FIELDS, counts):
+        arrays[name] = int_buffer(body, offset, count)
+        offset += 4 * count
+    if offset != len(body):
+        raise ValueError("Buffer binar cu octeți în plus.")
+    return compile_indexed(labels[:n_vars], labels[n_vars:], **arrays)
+
+
+def encode_problem(variables: List[str], values: List[str], domain_offsets, domain_values,
+                   edges, alldiff_offsets=(), alldiff_members=()) -> bytes:
+    """Corpul binar pentru o problemă deja indexată (folosit de clienți și de benchmark)."""
+    labels = "\0".join(list(variables) + list(values)).encode("utf-8")
+    arrays = (domain_offsets, domain_values, edges, alldiff_offsets, alldiff_members)
+    header = [len(variables), len(values), len(labels)] + [len(a) for a in arrays]
+    parts = [MAGIC, pack_ints(header), labels, b"\0" * (-len(labels) % 4)]
+    parts.extend(pack_ints(a) for a in arrays)
+    return b"".join(parts)
+
+
+def encode_result(assignment: Optional[List[int]], status: str, stats: Dict[str, int],
+                  kind: str) -> Tuple[bytes, Dict[str, str]]:
+    """(corpul, antete suplimentare) pentru răspuns."""
+    if kind == BINARY:
+        return pack_ints(assignment or []), {"X-CSP-Status": status}
+    return dump_document({"status": status, "assignment": assignment, "stats": stats}, kind), {}
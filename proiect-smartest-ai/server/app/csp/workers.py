@@ -0,0 +1,146 @@
+"""
+Pool-ul de procese comun pentru joburi, portofoliu și componentele rezolvate în paralel.
+
+Există un singur pool, creat la pornirea aplicației (`solver_pool.start()` din
+lifespan) sau la prima folosire, cu contextul "forkserver" ("spawn" unde nu
+există): workerii nu se mai obțin prin fork dintr-un proces uvicorn cu mai
+multe thread-uri și nu se mai creează un pool nou la fiecare cerere.
+
+Anularea merge ca la joburi: un vector de flag-uri în memorie partajată, câte un
+slot per cerere (`Batch`), citit de bugetul de căutare din worker. Slotul se
+eliberează abia după ce toate task-urile cererii s-au terminat, ca un worker
+întârziat să nu vadă flag-ul resetat de altă cerere.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Optional
+
+MAX_WORKERS = int(os.getenv("CSP_POOL_WORKERS", "0")) or (os.cpu_count() or 1)
+MAX_BATCHES = 256   # cereri cu task-uri în pool simultan (sloturi de anulare)
+
+_cancel_flags = None
+
+
+def _init_worker(flags) -> None:
+    global _cancel_flags
+    _cancel_flags = flags
+
+
+class SlotFlag:
+    """Adaptor `is_set()` peste un slot din vectorul partajat, pentru `SearchBudget` (în worker)."""
+
+    def __init__(self, slot: int):
+        self.slot = slot
+
+    def is_set(self) -> bool:
+        return bool(_cancel_flags[self.slot])
+
+
+class PoolBusy(Exception):
+    pass
+
+
+def _start_method() -> str:
+    return "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+class Batch:
+    """
+    Task-urile unei cereri, cu un slot de anulare comun. Funcția trimisă primește
+    slotul ca prim argument. La ieșirea din `with`, task-urile rămase sunt anulate.
+    """
+
+    def __init__(self, pool: "SolverPool", slot: int):
+        self._pool = pool
+        self.slot = slot
+        self.futures: List[Future] = []
+
+    def submit(self, fn: Callable, *args) -> Future:
+        future = self._pool.submit(fn, self.slot, *args)
+        self.futures.append(future)
+        return future
+
+    def cancel(self) -> None:
+        """Task-urile încă în coadă sunt anulate, cele care rulează văd flag-ul la următorul tick."""
+        self._pool.set_flag(self.slot)
+        for future in self.futures:
+            future.cancel()
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cancel()
+        self._pool.release_after(self.slot, self.futures)
+
+
+class SolverPool:
+    def __init__(self, max_workers: int = MAX_WORKERS, max_batches: int = MAX_BATCHES):
+        self.max_workers = max_workers
+        self._context = multiprocessing.get_context(_start_method())
+        self._flags = self._context.RawArray("b", max_batches)
+        self._free_slots: List[int] = list(range(max_batches - 1, -1, -1))
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=self._context,
+                                                 initializer=_init_worker, initargs=(self._flags,))
+            return self._pool
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            self._flags[:] = b"\x01" * len(self._flags)
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def submit(self, fn: Callable, *args) -> Future:
+        try:
+            return self.start().submit(fn, *args)
+        except BrokenProcessPool:
+            # un worker a murit (ex. OOM): pornim un pool nou
+            with self._lock:
+                self._pool = None
+            return self.start().submit(fn, *args)
+
+    def batch(self) -> Batch:
+        with self._lock:
+            if not self._free_slots:
+                raise PoolBusy()
+            slot = self._free_slots.pop()
+            self._flags[slot] = 0
+        return Batch(self, slot)
+
+    def set_flag(self, slot: int) -> None:
+        self._flags[slot] = 1
+
+    def release_after(self, slot: int, futures: List[Future]) -> None:
+        """Eliberează slotul când s-au terminat (sau au fost anulate) toate `futures`."""
+        left = [len(futures)]
+        lock = threading.Lock()
+
+        def done(_) -> None:
+            with lock:
+                left[0] -= 1
+                last = left[0] == 0
+            if last:
+                self._release(slot)
+
+        if not futures:
+            self._release(slot)
+        for future in futures:
+            future.add_done_callback(done)
+
+    def _release(self, slot: int) -> None:
+        with self._lock:
+            self._free_slots.append(slot)
+
+
+solver_pool = SolverPool()
@@ -1,15 +1,28 @@
 # server/app/main.py
 
 import os  # 👈 LIPSEA IMPORTUL ĂSTA!
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.nash.api import router as nash_router
 from app.csp.api import router as csp_router
+from app.csp.workers import solver_pool
+from app.metrics import MetricsMiddleware, router as metrics_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # pool-ul de procese pentru portofoliu / componente paralele trăiește cât serverul
+    solver_pool.start()
+    yield
+    solver_pool.shutdown()
+
 
 app = FastAPI(
     title="SmarTest (simplu)",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # ---------------------- CORS (dev) ----------------------
@@ -29,8 +42,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Profile-Id"],
 )
 
+# ---------------------- Metrici ----------------------
+# adăugat ultimul, deci e middleware-ul exterior: latența include și CORS
+app.add_middleware(MetricsMiddleware)
+
 # ---------------------- Health ----------------------
 @app.get("/", tags=["health"])
 def root():
@@ -39,3 +57,4 @@ def root():
 # ---------------------- API v1 ----------------------
 app.include_router(nash_router, prefix="/api/v1")
 app.include_router(csp_router, prefix="/api/v1")
+app.include_router(metrics_router)
@@ -0,0 +1,209 @@
+"""
+Metrici HTTP și endpoint-ul `GET /metrics` (text Prometheus).
+
+- `MetricsMiddleware` măsoară fiecare cerere HTTP: histograma latenței per rută
+  (șablonul rutei, ex. `/api/v1/csp/jobs/{job_id}`, nu calea concretă), numărul
+  de cereri per status și dimensiunea payload-urilor (ultima și maximă).
+- Contoarele solverilor CSP sunt în `app.telemetry` (fără dependențe de FastAPI)
+  și apar în același răspuns.
+- Profilerul prin eșantionare e opțional: cu `METRICS_PROFILING=1`, o cerere cu
+  antetul `X-Profile: 1` e eșantionată la `METRICS_PROFILE_INTERVAL_MS` și
+  primește `X-Profile-Id`; stivele (format „collapsed”, pentru flamegraph /
+  speedscope) se citesc din `GET /metrics/profiles/{profile_id}`.
+  Dezactivat, costul e o singură verificare de flag per cerere.
+"""
+
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter as _Tally
+from typing import Dict, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app.cache import LRUCache
+from app.telemetry import Counter, Gauge, Histogram, render
+
+PROFILING = os.getenv("METRICS_PROFILING", "0") == "1"
+PROFILE_INTERVAL = float(os.getenv("METRICS_PROFILE_INTERVAL_MS", "5")) / 1000
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# -------------------------------------------------
+# Metricile HTTP
+# -------------------------------------------------
+
+REQUEST_LATENCY = Histogram("smartest_http_request_duration_seconds",
+                            "Latența cererilor HTTP, per rută.", ("method", "route"))
+REQUESTS = Counter("smartest_http_requests_total", "Cereri HTTP, per rută și status.",
+                   ("method", "route", "status"))
+REQUEST_BYTES = Gauge("smartest_http_request_bytes", "Dimensiunea ultimului corp de cerere.", ("route",))
+REQUEST_BYTES_MAX = Gauge("smartest_http_request_bytes_max", "Cel mai mare corp de cerere.", ("route",))
+RESPONSE_BYTES = Gauge("smartest_http_response_bytes", "Dimensiunea ultimului răspuns.", ("route",))
+RESPONSE_BYTES_MAX = Gauge("smartest_http_response_bytes_max", "Cel mai mare răspuns.", ("route",))
+
+
+# -------------------------------------------------
+# Profiler prin eșantionare
+# -------------------------------------------------
+
+_THIS_FILE = os.path.abspath(__file__)
+_APP_DIR = os.path.dirname(_THIS_FILE)
+
+# profilurile terminate (profile_id -> text „collapsed”)
+profiles = LRUCache(maxsize=64, ttl=3600.0, max_cost=64 * 1024 * 1024)
+
+
+def _collapse(frame) -> Optional[str]:
+    """Stiva unui thread ca „f1;f2;...;fN”, de la primul cadru din aplicație; None dacă nu e cod de-al nostru."""
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        ours = code.co_filename.startswith(_APP_DIR) and code.co_filename != _THIS_FILE
+        where = code.co_filename[len(_APP_DIR) + 1:] if ours else os.path.basename(code.co_filename)
+        stack.append((ours, f"{where}:{code.co_name}"))
+        frame = frame.f_back
+    stack.reverse()
+    for start, (ours, _) in enumerate(stack):
+        if ours:
+            return ";".join(name for _, name in stack[start:])
+    return None
+
+
+class SamplingProfiler(threading.Thread):
+    """
+    Citește periodic stivele tuturor thread-urilor (`sys._current_frames`) și
+    numără stivele care trec prin codul aplicației. Endpoint-urile sincrone rulează
+    în threadpool, deci nu e suficient să eșantionăm doar thread-ul cererii; cererile
+    concurente apar și ele în profil.
+    """
+
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        super().__init__(name="metrics-profiler", daemon=True)
+        self.interval = interval
+        self.stacks: "_Tally[str]" = _Tally()
+        self.samples = 0
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        me = threading.get_ident()
+        while not self._done.wait(self.interval):
+            self.samples += 1
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                stack = _collapse(frame)
+                if stack is not None:
+                    self.stacks[stack] += 1
+
+    def stop(self) -> str:
+        self._done.set()
+        self.join()
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+# -------------------------------------------------
+# Middleware ASGI
+# -------------------------------------------------
+
+class MetricsMiddleware:
+    """Timpul, statusul și dimensiunile fiecărei cereri HTTP, plus profilarea la cerere."""
+
+    def __init__(self, app):
+        self.app = app
+        # seriile metricilor, legate o dată per (metodă, rută, status)
+        self._series: Dict[Tuple[str, str, int], tuple] = {}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        sent = 0
+        profiler = None
+        profile_id = None
+        if PROFILING and (b"x-profile", b"1") in scope["headers"]:
+            profile_id = uuid.uuid4().hex
+            profiler = SamplingProfiler()
+            profiler.start()
+
+        async def send_wrapper(message):
+            nonlocal status, sent
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if profile_id is not None:
+                    message = {**message, "headers": [*message.get("headers", []),
+                                                      (b"x-profile-id", profile_id.encode())]}
+            elif message["type"] == "http.response.body":
+                sent += len(message.get("body", b""))
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            if profiler is not None:
+                report = profiler.stop()
+                profiles.put(profile_id, report, cost=len(report) + 1)
+            route = scope.get("route")
+            # căile fără rută (404) nu primesc etichete proprii, ca să nu explodeze cardinalitatea
+            path = getattr(route, "path_format", None) or "<unmatched>"
+            series = self._series.get((scope["method"], path, status))
+            if series is None:
+                series = self._bind(scope["method"], path, status)
+            latency, requests, received, received_max, returned, returned_max = series
+            latency.observe(elapsed)
+            requests.inc()
+            size = _content_length(scope["headers"])
+            received.set(size)
+            received_max.set_max(size)
+            returned.set(sent)
+            returned_max.set_max(sent)
+
+    def _bind(self, method: str, path: str, status: int) -> tuple:
+        series = (
+            REQUEST_LATENCY.labels(method=method, route=path),
+            REQUESTS.labels(method=method, route=path, status=status),
+            REQUEST_BYTES.labels(route=path),
+            REQUEST_BYTES_MAX.labels(route=path),
+            RESPONSE_BYTES.labels(route=path),
+            RESPONSE_BYTES_MAX.labels(route=path),
+        )
+        self._series[(method, path, status)] = series
+        return series
+
+
+def _content_length(headers) -> int:
+    for name, value in headers:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return 0
+    return 0
+
+
+# -------------------------------------------------
+# Endpoint-uri
+# -------------------------------------------------
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    return PlainTextResponse(render(), media_type=CONTENT_TYPE)
+
+
+@router.get("/metrics/profiles/{profile_id}", include_in_schema=False)
+def get_profile(profile_id: str):
+    report = profiles.get(profile_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Profil inexistent sau expirat.")
+    return PlainTextResponse(report)
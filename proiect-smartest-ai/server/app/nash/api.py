@@ -1,18 +1,39 @@
 # app/nash/api.py
 
-from fastapi import APIRouter
-from typing import List, Dict, Tuple
-import re
-import unicodedata
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+import random
+from typing import List, Dict, Literal, Optional
+
+import numpy as np
 
 from app.nash.models import (
     NashProblem,
     SolveResponse,
     NashEquilibrium,
     EvaluateRequest,
+    EvaluateBatchRequest,
+    EvaluateBatchResponse,
+    BatchResult,
+    NPlayerProblem,
+    NPlayerEquilibrium,
+    NPlayerSolveResponse,
+    DominanceStep,
+    ReduceResponse,
+    MixedEquilibrium,
+    MixedSolveResponse,
+)
+from app.nash.engine import (
+    as_payoff_tensor, bimatrix_equilibria, flat_bimatrix_equilibria, pure_equilibria, pure_nash,
 )
-from app.nash.logic import pure_nash_equilibria
-from app.nash.question_generator import generate_random_nash_question
+from app.nash.dominance import eliminate_dominated
+from app.nash.mixed import mixed_equilibria
+from app.nash.grading import AnswerKey, score_answer, score_batch
+from app.nash.canonical import equilibria_cached, nash_cache
+from app.nash.question_bank import prepare_question, questions, serve
+from app.nash.wire import decode_game, encode_equilibria
+from app.wire import UnsupportedFormat, media_type
 
 router = APIRouter(prefix="/nash", tags=["nash"])
 
@@ -20,88 +41,9 @@ router = APIRouter(prefix="/nash", tags=["nash"])
 # Helpers
 # -------------------------------------------------
 
-def _strip_accents(s: str) -> str:
-    """Scoate diacriticele (ăâîșț -> aaiste)."""
-    return "".join(
-        c for c in unicodedata.normalize("NFD", s)
-        if unicodedata.category(c) != "Mn"
-    )
-
-
-def _norm(s: str) -> str:
-    """Normalizează: fără diacritice, lowercase, spații comprimate."""
-    s = _strip_accents(s).lower()
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
-
-
-def _extract_labels_from_equilibria(correct_equilibria: List[str]) -> List[str]:
-    """
-    Din ["(Sus, Stânga)", "(Jos, Dreapta)"] scoate ["Sus", "Stânga", "Jos", "Dreapta"].
-    Folosim asta doar pentru bonusul de 10% (a folosit etichete din tabel).
-    """
-    labels: set[str] = set()
-    for eq in correct_equilibria:
-        m = re.search(r"\((.*?)\)", eq)
-        if not m:
-            continue
-        for part in m.group(1).split(","):
-            p = part.strip()
-            if p:
-                labels.add(p)
-    return list(labels)
-
-
-def _parse_pairs(text: str) -> List[Tuple[str, str]]:
-    """
-    Extrage toate perechile (a, b) din răspunsul studentului și le normalizează.
-
-    Exemplu:
-        text = "Sunt două: (Sus, Stânga) și (Jos, Dreapta)"
-        => [("sus", "stanga"), ("jos", "dreapta")]
-    """
-    pairs: List[Tuple[str, str]] = []
-
-    # căutăm TOATE parantezele din răspunsul studentului
-    for m in re.finditer(r"\(([^()]*)\)", text):
-        inside = m.group(1)
-        parts = [p.strip() for p in inside.split(",")]
-        if len(parts) != 2:
-            continue
-        a, b = parts
-        if a and b:
-            pairs.append((_norm(a), _norm(b)))
-    return pairs
-
-
-def _norm_eq_list(correct_equilibria: List[str]) -> List[Tuple[str, str]]:
-    """
-    Normalizează echilibrele corecte în perechi (lhs, rhs) deja normalizate.
-
-    ["(Sus, Stânga)"] -> [("sus", "stanga")]
-    """
-    norm: List[Tuple[str, str]] = []
-    for eq in correct_equilibria:
-        m = re.search(r"\((.*?)\)", eq)
-        if not m:
-            continue
-        parts = [p.strip() for p in m.group(1).split(",")]
-        if len(parts) != 2:
-            continue
-        norm.append((_norm(parts[0]), _norm(parts[1])))
-    return norm
-
-
-def _count_matched_pairs(answer: str, correct_equilibria: List[str]) -> int:
-    """
-    Numără câte perechi corecte apar în răspunsul studentului.
-
-    - perechile pot fi în orice ordine
-    - comparația se face pe string normalizat
-    """
-    ans_pairs = set(_parse_pairs(answer))
-    corr_pairs = set(_norm_eq_list(correct_equilibria))
-    return len(ans_pairs.intersection(corr_pairs))
+def _mix_name(probs: List[float], labels: List[str]) -> str:
+    """[0.6, 0.4], ["Sus", "Jos"] -> "0.6·Sus + 0.4·Jos" (doar strategiile din suport)."""
+    return " + ".join(f"{p:g}·{label}" for p, label in zip(probs, labels) if p > 0)
 
 
 # -------------------------------------------------
@@ -110,7 +52,7 @@ def _count_matched_pairs(answer: str, correct_equilibria: List[str]) -> int:
 
 @router.post("/solve", response_model=SolveResponse)
 def solve_nash(problem: NashProblem):
-    idx = pure_nash_equilibria(problem.p1_payoffs, problem.p2_payoffs)
+    idx = equilibria_cached("pure", pure_nash, problem.p1_payoffs, problem.p2_payoffs)
     equilibria = [
         NashEquilibrium(
             row=r,
@@ -134,20 +76,181 @@ def solve_nash(problem: NashProblem):
     )
 
 
+@router.post("/solve-mixed", response_model=MixedSolveResponse)
+def solve_nash_mixed(
+    problem: NashProblem,
+    mode: Literal["first", "all"] = "first",
+    time_limit: float = Query(2.0, gt=0, le=30),
+):
+    """
+    Echilibre în strategii mixte: "first" întoarce un echilibru (Lemke–Howson),
+    "all" le enumeră prin suporturi până la `time_limit` secunde.
+    """
+    result = mixed_equilibria(problem.p1_payoffs, problem.p2_payoffs, mode=mode, time_limit=time_limit)
+    A, B = np.asarray(problem.p1_payoffs), np.asarray(problem.p2_payoffs)
+    equilibria = []
+    for x, y in result.equilibria:
+        p1 = [round(float(p), 6) for p in x]
+        p2 = [round(float(p), 6) for p in y]
+        equilibria.append(MixedEquilibrium(
+            p1=p1,
+            p2=p2,
+            p1_payoff=round(float(x @ A @ y), 6),
+            p2_payoff=round(float(x @ B @ y), 6),
+            name=f"({_mix_name(p1, problem.p1_strategies)}, {_mix_name(p2, problem.p2_strategies)})",
+        ))
+
+    if equilibria:
+        message = f"Au fost găsite {len(equilibria)} echilibre Nash." if len(equilibria) > 1 else "A fost găsit un echilibru Nash."
+    else:
+        message = "Nu a fost găsit niciun echilibru în limita de timp."
+    if not result.complete:
+        message += " Căutarea a fost oprită de limita de timp."
+
+    return MixedSolveResponse(equilibria=equilibria, method=result.method, complete=result.complete, message=message)
+
+
+@router.post("/reduce", response_model=ReduceResponse)
+def reduce_nash(problem: NashProblem, weak: bool = False):
+    """
+    Elimină iterativ strategiile strict (sau, cu `weak=true`, și slab) dominate și
+    caută echilibrele pure pe jocul redus.
+    """
+    red = eliminate_dominated(problem.p1_payoffs, problem.p2_payoffs, weak=weak)
+    names = {1: problem.p1_strategies, 2: problem.p2_strategies}
+    trace = [
+        DominanceStep(
+            round=step["round"],
+            player=step["player"],
+            index=step["index"],
+            strategy=names[step["player"]][step["index"]],
+            dominated_by=names[step["player"]][step["dominated_by"]],
+            kind=step["kind"],
+        )
+        for step in red.trace
+    ]
+    equilibria = [
+        NashEquilibrium(
+            row=red.rows[r],
+            col=red.cols[c],
+            name=f"({problem.p1_strategies[red.rows[r]]}, {problem.p2_strategies[red.cols[c]]})",
+        )
+        for r, c in bimatrix_equilibria(red.p1, red.p2).tolist()
+    ]
+    removed = len(problem.p1_strategies) - len(red.rows) + len(problem.p2_strategies) - len(red.cols)
+
+    return ReduceResponse(
+        p1_payoffs=red.p1.tolist(),
+        p2_payoffs=red.p2.tolist(),
+        p1_strategies=[problem.p1_strategies[r] for r in red.rows],
+        p2_strategies=[problem.p2_strategies[c] for c in red.cols],
+        row_map=red.rows,
+        col_map=red.cols,
+        trace=trace,
+        equilibria=equilibria,
+        message=f"Au fost eliminate {removed} strategii dominate." if removed else "Nicio strategie dominată.",
+    )
+
+
+@router.post("/solve-nplayer", response_model=NPlayerSolveResponse)
+def solve_nash_nplayer(problem: NPlayerProblem):
+    try:
+        tensor = as_payoff_tensor(problem.payoffs, problem.shape)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    strategies = problem.strategies or [[str(k + 1) for k in range(s)] for s in problem.shape]
+    if [len(s) for s in strategies] != list(problem.shape):
+        raise HTTPException(status_code=400, detail="Numărul de etichete nu corespunde formei jocului.")
+
+    equilibria = [
+        NPlayerEquilibrium(
+            profile=profile.tolist(),
+            name="(" + ", ".join(strategies[i][a] for i, a in enumerate(profile)) + ")",
+        )
+        for profile in pure_equilibria(tensor)
+    ]
+
+    if equilibria:
+        return NPlayerSolveResponse(
+            has_equilibrium=True,
+            equilibria=equilibria,
+            message="Există cel puțin un echilibru Nash pur.",
+        )
+
+    return NPlayerSolveResponse(
+        has_equilibrium=False,
+        equilibria=[],
+        message="Nu există echilibru Nash pur.",
+    )
+
+
+@router.post("/solve-compact")
+async def solve_nash_compact(request: Request):
+    """
+    Jocul cu câștiguri plate, row-major (JSON, msgpack sau binar, vezi
+    app/nash/wire.py); răspunsul sunt perechile (rând, coloană), plate.
+    """
+    try:
+        kind = media_type(request.headers.get("content-type"))
+    except UnsupportedFormat as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    body = await request.body()
+
+    def solve():
+        rows, cols, p1, p2 = decode_game(body, kind)
+        return encode_equilibria(flat_bimatrix_equilibria(rows, cols, p1, p2), kind)
+
+    try:
+        content = await run_in_threadpool(solve)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content, media_type=kind)
+
+
+@router.get("/cache")
+def nash_cache_stats():
+    return nash_cache.stats()
+
+
 # -------------------------------------------------
 # /generate
 # -------------------------------------------------
 
 @router.get("/generate")
-def generate_question():
-    q = generate_random_nash_question()
-    return {
-        "question": q["question_text"],
-        "p1_strategies": q["p1_strategies"],
-        "p2_strategies": q["p2_strategies"],
-        "p1_payoffs": q["p1_payoffs"],
-        "p2_payoffs": q["p2_payoffs"],
-    }
+def generate_question(
+    rows: Optional[int] = Query(None, ge=1, le=10),
+    cols: Optional[int] = Query(None, ge=1, le=10),
+    equilibria: Optional[int] = Query(None, ge=0, le=10),
+    dominated: int = Query(0, ge=0, le=5),
+    seed: Optional[int] = None,
+):
+    """
+    Fără parametri: o întrebare din banca pregătită dinainte. Cu parametri, jocul
+    se construiește pe loc după specificație (dimensiune, număr de echilibre pure,
+    strategii dominate, seed). `rows` × `cols` e dimensiunea finală: `dominated`
+    rânduri și coloane din ea sunt strict dominate, deci trebuie `dominated < min(rows, cols)`.
+    Baremul rămâne pe server, pentru /evaluate-batch.
+    """
+    if rows is None and cols is None and equilibria is None and not dominated and seed is None:
+        return questions.pop()
+
+    rng = random.Random(seed)
+    # rows/cols sunt dimensiunile finale, cu tot cu strategiile dominate
+    rows = rows or cols or rng.choice([2, 3]) + dominated
+    cols = cols or rows
+    if equilibria is None:
+        free = min(rows, cols) - dominated
+        equilibria = rng.randint(0 if free > 1 else 1, max(free, 1))
+    try:
+        prepared = prepare_question(rows, cols, equilibria, dominated, seed=rng.getrandbits(64))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return serve(prepared)
+
+
+@router.get("/generate/pool")
+def question_pool_stats():
+    return questions.stats()
 
 
 # -------------------------------------------------
@@ -156,54 +259,22 @@ def generate_question():
 
 @router.post("/evaluate")
 def evaluate_answer(request: EvaluateRequest) -> Dict:
-    """
-    Scorare:
-      - dacă NU există NE pur și răspunsul conține 'nu' -> 100%
-      - dacă există N echilibre și răspunsul conține k dintre ele -> round(100*k/N)
-      - dacă k = 0 dar răspunsul conține etichete din tabel -> 10%
-      - altfel -> 0%
-    """
-    answer_raw = request.student_answer or ""
-    answer_norm = _norm(answer_raw)
-    correct_eq = request.correct_equilibria or []
-    total = len(correct_eq)
-
-    # 1) NU există echilibru Nash pur
-    if total == 0:
-        if "nu" in answer_norm:
-            return {
-                "score": 100,
-                "feedback": "Corect – pentru acest joc nu există echilibru Nash pur.",
-            }
-        return {
-            "score": 0,
-            "feedback": "Răspuns incorect. Pentru acest joc nu există echilibru Nash pur.",
-        }
-
-    # 2) Există unul sau mai multe NE – numărăm perechile corecte
-    matched = _count_matched_pairs(answer_raw, correct_eq)
-
-    if matched > 0:
-        score = round(100 * matched / total)
-        if score == 100:
-            fb = "Perfect! Ai identificat toate echilibrele Nash."
-        elif matched == 1 and total > 1:
-            fb = f"Parțial corect – ai identificat 1 din {total} echilibre Nash."
-        else:
-            fb = f"Parțial corect – ai identificat {matched} din {total} echilibre Nash."
-        return {"score": score, "feedback": fb}
-
-    # 3) Nu a nimerit niciun NE, dar a folosit etichete corecte din tabel -> 10%
-    labels = _extract_labels_from_equilibria(correct_eq)
-    labels_norm = [_norm(l) for l in labels]
-    if any(l in answer_norm for l in labels_norm):
-        return {
-            "score": 10,
-            "feedback": "Ai folosit etichete din tabel, dar nu ai indicat un echilibru corect.",
-        }
-
-    # 4) Complet greșit
-    return {
-        "score": 0,
-        "feedback": "Răspuns incorect. Încearcă să identifici perechile unde ambii jucători au răspunsuri optime.",
-    }
+    """Scorează un răspuns față de echilibrele primite (regulile sunt în `grading.score_answer`)."""
+    return score_answer(AnswerKey(request.correct_equilibria or []), request.student_answer)
+
+
+@router.post("/evaluate-batch", response_model=EvaluateBatchResponse)
+def evaluate_batch(request: EvaluateBatchRequest):
+    """Scorează multe răspunsuri la întrebări generate anterior, după `question_id`."""
+    scored = score_batch((item.question_id, item.student_answer) for item in request.answers)
+    results = [
+        BatchResult(question_id=item.question_id, **r) if r is not None
+        else BatchResult(question_id=item.question_id, score=None, feedback="Întrebare necunoscută sau expirată.")
+        for item, r in zip(request.answers, scored)
+    ]
+    graded = [r.score for r in results if r.score is not None]
+    return EvaluateBatchResponse(
+        results=results,
+        graded=len(graded),
+        average=round(sum(graded) / len(graded), 2) if graded else None,
+    )
@@ -0,0 +1,55 @@
+"""
+Forma canonică a unui joc bimatriceal, până la permutarea rândurilor și coloanelor.
+
+Rândurile se ordonează după multisetul perechilor (p1, p2) de pe rând (invariant
+la permutarea coloanelor), coloanele la fel, apoi ordinea se rafinează de câteva
+ori folosind conținutul efectiv. Cheia conține jocul permutat complet, deci nu
+pot exista coliziuni; simetriile nedepartajate costă cel mult un hit ratat.
+Echilibrele memorate sunt în indici canonici și se traduc înapoi prin permutări.
+"""
+
+from typing import Callable, List, Tuple
+
+from app.cache import LRUCache
+
+nash_cache = LRUCache(maxsize=4096, ttl=3600.0, max_cost=20_000_000)
+
+_ROUNDS = 3
+_MAX_CACHED_CELLS = 10_000  # peste atât, forma canonică (în Python) costă mai mult decât rezolvarea
+
+
+def canonical_game(p1: List[List[int]], p2: List[List[int]]) -> Tuple[tuple, List[int], List[int]]:
+    """Întoarce (cheia, rows, cols): rândul canonic k este rândul original rows[k]; analog coloanele."""
+    n_rows, n_cols = len(p1), len(p1[0]) if p1 else 0
+    cells = [[(p1[r][c], p2[r][c]) for c in range(n_cols)] for r in range(n_rows)]
+
+    rows = sorted(range(n_rows), key=lambda r: (sorted(cells[r]), r))
+    cols = sorted(range(n_cols), key=lambda c: (sorted(cells[r][c] for r in range(n_rows)), c))
+    for _ in range(_ROUNDS):
+        new_rows = sorted(rows, key=lambda r: tuple(cells[r][c] for c in cols))
+        new_cols = sorted(cols, key=lambda c: tuple(cells[r][c] for r in new_rows))
+        if new_rows == rows and new_cols == cols:
+            break
+        rows, cols = new_rows, new_cols
+
+    key = (n_rows, n_cols, tuple(tuple(cells[r][c] for c in cols) for r in rows))
+    return key, rows, cols
+
+
+def equilibria_cached(name: str, solver: Callable, p1, p2) -> List[Tuple[int, int]]:
+    """
+    `solver(p1, p2) -> [(rând, coloană), ...]` prin cache. Jocul se rezolvă în
+    forma canonică, iar rezultatul se traduce în indicii jocului primit.
+    Jocurile mari se rezolvă direct, fără cache.
+    """
+    if len(p1) * (len(p1[0]) if p1 else 0) > _MAX_CACHED_CELLS:
+        return sorted(solver(p1, p2))
+    key, rows, cols = canonical_game(p1, p2)
+    key = (name, key)
+    cached = nash_cache.get(key)
+    if cached is None:
+        canon_p1 = [[p1[r][c] for c in cols] for r in rows]
+        canon_p2 = [[p2[r][c] for c in cols] for r in rows]
+        cached = tuple(solver(canon_p1, canon_p2))
+        nash_cache.put(key, cached, cost=len(rows) * len(cols))
+    return sorted((rows[r], cols[c]) for r, c in cached)
@@ -0,0 +1,69 @@
+"""
+Eliminarea iterată a strategiilor dominate, ca pas de preprocesare înaintea
+căutării echilibrelor.
+
+Într-o rundă, jucătorul 1 pierde toate rândurile dominate de un alt rând încă
+activ, apoi jucătorul 2 toate coloanele dominate, până nu se mai schimbă nimic.
+Verificarea "rândul i e dominat de rândul j" se face pentru toți i deodată
+(o comparație numpy pe matricea rămasă), deci o rundă costă O(r^2 c) operații
+vectorizate și memorie O(r c).
+
+Dominanța strictă păstrează toate echilibrele Nash (pure și mixte). Dominanța
+slabă poate pierde echilibre și rezultatul depinde de ordinea eliminărilor;
+o folosim doar la cerere.
+"""
+
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+
+
+class Reduction(NamedTuple):
+    p1: np.ndarray             # câștigurile jocului redus
+    p2: np.ndarray
+    rows: List[int]            # rândul redus k este rândul original rows[k]
+    cols: List[int]
+    trace: List[Dict]          # pașii eliminării, în ordine
+
+
+def _dominated(payoff: np.ndarray, weak: bool) -> Dict[int, int]:
+    """{i: j} pentru rândurile i dominate de un rând j (indici locali)."""
+    found: Dict[int, int] = {}
+    for j in range(payoff.shape[0]):
+        if weak:
+            mask = (payoff <= payoff[j]).all(axis=1) & (payoff < payoff[j]).any(axis=1)
+        else:
+            mask = (payoff < payoff[j]).all(axis=1)
+        for i in np.flatnonzero(mask):
+            found.setdefault(int(i), j)
+    return found
+
+
+def eliminate_dominated(p1, p2, weak: bool = False) -> Reduction:
+    """Jocul redus, harta indicilor spre jocul original și urma eliminărilor."""
+    a, b = np.asarray(p1), np.asarray(p2)
+    rows, cols = list(range(a.shape[0])), list(range(a.shape[1]))
+    trace: List[Dict] = []
+    kind = "weak" if weak else "strict"
+    step = 0
+    changed = True
+    while changed:
+        changed = False
+        step += 1
+        # jucătorul 1 compară rânduri (câștigurile lui pe coloanele rămase)
+        found = _dominated(a, weak) if len(rows) > 1 else {}
+        if found:
+            trace.extend({"round": step, "player": 1, "index": rows[i], "dominated_by": rows[j], "kind": kind}
+                         for i, j in sorted(found.items()))
+            keep = [k for k in range(len(rows)) if k not in found]
+            a, b, rows = a[keep], b[keep], [rows[k] for k in keep]
+            changed = True
+        # jucătorul 2 compară coloane
+        found = _dominated(b.T, weak) if len(cols) > 1 else {}
+        if found:
+            trace.extend({"round": step, "player": 2, "index": cols[i], "dominated_by": cols[j], "kind": kind}
+                         for i, j in sorted(found.items()))
+            keep = [k for k in range(len(cols)) if k not in found]
+            a, b, cols = a[:, keep], b[:, keep], [cols[k] for k in keep]
+            changed = True
+    return Reduction(a, b, rows, cols, trace)
@@ -0,0 +1,76 @@
+"""
+Motor vectorizat (numpy) pentru echilibre Nash pure.
+
+Un joc cu n jucători se ține ca tensor de câștiguri cu forma (n, s1, ..., sn):
+payoffs[i][a1, ..., an] este câștigul jucătorului i pentru profilul (a1, ..., an).
+Jucătorul i răspunde optim exact acolo unde câștigul lui atinge maximul de-a lungul
+axei proprii, deci masca de best-response e o singură comparație cu maximul pe
+axă. Un profil e echilibru dacă e în toate măștile; rezultatul este tabloul
+indicilor (k, n), fără seturi de tupluri.
+
+Pentru bimatrice (n = 2), jucătorul 1 alege rândul și jucătorul 2 coloana,
+la fel ca în `logic.pure_nash_equilibria`. Pe jocurile mici (2x2, 3x3, cât produce
+generatorul) costul fix al numpy domină, așa că `pure_nash` alege varianta Python
+sub `ARRAY_MIN_CELLS` celule (pragul de unde numpy câștigă, măsurat cu bench-ul).
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .logic import pure_nash_equilibria
+
+ARRAY_MIN_CELLS = 200
+
+
+def as_payoff_tensor(payoffs: Sequence, shape: Sequence[int]) -> np.ndarray:
+    """Câștigurile plate (row-major) ale fiecărui jucător -> tensorul (n, s1, ..., sn)."""
+    shape = tuple(shape)
+    if len(payoffs) != len(shape):
+        raise ValueError("Trebuie câte un tablou de câștiguri pentru fiecare jucător.")
+    if not shape or min(shape) < 1:
+        raise ValueError("Fiecare jucător trebuie să aibă cel puțin o strategie.")
+    size = int(np.prod(shape))
+    arrays = []
+    for i, flat in enumerate(payoffs):
+        flat = np.asarray(flat)
+        if flat.size != size:
+            raise ValueError(f"Jucătorul {i + 1} are {flat.size} câștiguri, nu {size}.")
+        arrays.append(flat.reshape(shape))
+    return np.stack(arrays)
+
+
+def best_response_mask(tensor: np.ndarray, player: int) -> np.ndarray:
+    """Masca profilurilor în care `player` joacă un răspuns optim la ceilalți."""
+    payoff = tensor[player]
+    return payoff == payoff.max(axis=player, keepdims=True)
+
+
+def pure_equilibria(tensor: np.ndarray) -> np.ndarray:
+    """Indicii profilurilor de echilibru, ca tablou (k, n), în ordine lexicografică."""
+    mask = best_response_mask(tensor, 0)
+    for player in range(1, tensor.shape[0]):
+        mask &= best_response_mask(tensor, player)
+    return np.argwhere(mask)
+
+
+def bimatrix_equilibria(p1, p2) -> np.ndarray:
+    """Echilibrele pure ale jocului bimatriceal (p1, p2), ca tablou (k, 2) de (rând, coloană)."""
+    return pure_equilibria(np.stack([np.asarray(p1), np.asarray(p2)]))
+
+
+def flat_bimatrix_equilibria(rows: int, cols: int, p1: Sequence[int], p2: Sequence[int]) -> np.ndarray:
+    """Ca `bimatrix_equilibria`, pe câștiguri plate row-major (liste sau buffere int32, fără copiere)."""
+    return bimatrix_equilibria(np.asarray(p1).reshape(rows, cols), np.asarray(p2).reshape(rows, cols))
+
+
+def pure_nash_array(p1: List[List[int]], p2: List[List[int]]) -> List[Tuple[int, int]]:
+    """Înlocuitor pentru `pure_nash_equilibria` cu aceeași ieșire (listă sortată de tupluri)."""
+    return [(int(r), int(c)) for r, c in bimatrix_equilibria(p1, p2)]
+
+
+def pure_nash(p1: List[List[int]], p2: List[List[int]]) -> List[Tuple[int, int]]:
+    """Echilibrele pure, cu motorul potrivit mărimii jocului (aceeași ieșire în ambele cazuri)."""
+    if len(p1) * (len(p1[0]) if p1 else 0) < ARRAY_MIN_CELLS:
+        return pure_nash_equilibria(p1, p2)
+    return pure_nash_array(p1, p2)
@@ -0,0 +1,207 @@
+"""
+Scorarea răspunsurilor la întrebările Nash și depozitul de bareme.
+
+Baremul unei întrebări (`AnswerKey`) se normalizează o singură dată: perechile
+corecte ca set de tupluri normalizate și etichetele din tabel ca un singur regex
+precompilat. La generare, baremul se păstrează pe server sub un `question_id`,
+iar evaluarea în lot (`score_batch`) îl refolosește pentru toate răspunsurile la
+aceeași întrebare; răspunsurile identice se scorează o singură dată.
+"""
+
+import re
+import unicodedata
+import uuid
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from app.cache import LRUCache
+
+# baremele întrebărilor generate (question_id -> AnswerKey)
+answer_keys = LRUCache(maxsize=100_000, ttl=24 * 3600.0, max_cost=100_000_000)
+
+_SPACES = re.compile(r"\s+")
+_ANSWER_PAIR = re.compile(r"\(([^()]*)\)")
+_KEY_PAIR = re.compile(r"\((.*?)\)")
+
+
+# -------------------------------------------------
+# Normalizare
+# -------------------------------------------------
+
+def _strip_accents(s: str) -> str:
+    """Scoate diacriticele (ăâîșț -> aaiste)."""
+    return "".join(
+        c for c in unicodedata.normalize("NFD", s)
+        if unicodedata.category(c) != "Mn"
+    )
+
+
+def _norm(s: str) -> str:
+    """Normalizează: fără diacritice, lowercase, spații comprimate."""
+    if not s.isascii():  # textul ASCII nu are diacritice, sărim descompunerea NFD
+        s = _strip_accents(s)
+    s = _SPACES.sub(" ", s.lower()).strip()
+    return s
+
+
+def _extract_labels_from_equilibria(correct_equilibria: List[str]) -> List[str]:
+    """
+    Din ["(Sus, Stânga)", "(Jos, Dreapta)"] scoate ["Sus", "Stânga", "Jos", "Dreapta"].
+    Folosim asta doar pentru bonusul de 10% (a folosit etichete din tabel).
+    """
+    labels: set[str] = set()
+    for eq in correct_equilibria:
+        m = _KEY_PAIR.search(eq)
+        if not m:
+            continue
+        for part in m.group(1).split(","):
+            p = part.strip()
+            if p:
+                labels.add(p)
+    return list(labels)
+
+
+def _parse_pairs(text: str) -> List[Tuple[str, str]]:
+    """
+    Extrage toate perechile (a, b) din răspunsul studentului și le normalizează.
+
+    Exemplu:
+        text = "Sunt două: (Sus, Stânga) și (Jos, Dreapta)"
+        => [("sus", "stanga"), ("jos", "dreapta")]
+    """
+    pairs: List[Tuple[str, str]] = []
+
+    # căutăm TOATE parantezele din răspunsul studentului
+    for m in _ANSWER_PAIR.finditer(text):
+        inside = m.group(1)
+        parts = [p.strip() for p in inside.split(",")]
+        if len(parts) != 2:
+            continue
+        a, b = parts
+        if a and b:
+            pairs.append((_norm(a), _norm(b)))
+    return pairs
+
+
+def _norm_eq_list(correct_equilibria: List[str]) -> List[Tuple[str, str]]:
+    """
+    Normalizează echilibrele corecte în perechi (lhs, rhs) deja normalizate.
+
+    ["(Sus, Stânga)"] -> [("sus", "stanga")]
+    """
+    norm: List[Tuple[str, str]] = []
+    for eq in correct_equilibria:
+        m = _KEY_PAIR.search(eq)
+        if not m:
+            continue
+        parts = [p.strip() for p in m.group(1).split(",")]
+        if len(parts) != 2:
+            continue
+        norm.append((_norm(parts[0]), _norm(parts[1])))
+    return norm
+
+
+# -------------------------------------------------
+# Barem și scorare
+# -------------------------------------------------
+
+class AnswerKey:
+    """Baremul normalizat al unei întrebări."""
+
+    __slots__ = ("total", "pairs", "labels")
+
+    def __init__(self, correct_equilibria: List[str]):
+        self.total = len(correct_equilibria)
+        self.pairs: FrozenSet[Tuple[str, str]] = frozenset(_norm_eq_list(correct_equilibria))
+        labels = sorted({_norm(l) for l in _extract_labels_from_equilibria(correct_equilibria)})
+        # un singur regex pentru "conține măcar o etichetă din tabel"
+        self.labels: Optional[re.Pattern] = re.compile("|".join(map(re.escape, labels))) if labels else None
+
+
+def score_answer(key: AnswerKey, answer_raw: str) -> Dict:
+    """
+    Scorare:
+      - dacă NU există NE pur și răspunsul conține 'nu' -> 100%
+      - dacă există N echilibre și răspunsul conține k dintre ele -> round(100*k/N)
+      - dacă k = 0 dar răspunsul conține etichete din tabel -> 10%
+      - altfel -> 0%
+    """
+    answer_raw = answer_raw or ""
+    answer_norm = _norm(answer_raw)
+    total = key.total
+
+    # 1) NU există echilibru Nash pur
+    if total == 0:
+        if "nu" in answer_norm:
+            return {
+                "score": 100,
+                "feedback": "Corect – pentru acest joc nu există echilibru Nash pur.",
+            }
+        return {
+            "score": 0,
+            "feedback": "Răspuns incorect. Pentru acest joc nu există echilibru Nash pur.",
+        }
+
+    # 2) Există unul sau mai multe NE – numărăm perechile corecte
+    matched = len(key.pairs.intersection(_parse_pairs(answer_raw)))
+
+    if matched > 0:
+        score = round(100 * matched / total)
+        if score == 100:
+            fb = "Perfect! Ai identificat toate echilibrele Nash."
+        elif matched == 1 and total > 1:
+            fb = f"Parțial corect – ai identificat 1 din {total} echilibre Nash."
+        else:
+            fb = f"Parțial corect – ai identificat {matched} din {total} echilibre Nash."
+        return {"score": score, "feedback": fb}
+
+    # 3) Nu a nimerit niciun NE, dar a folosit etichete corecte din tabel -> 10%
+    if key.labels is not None and key.labels.search(answer_norm):
+        return {
+            "score": 10,
+            "feedback": "Ai folosit etichete din tabel, dar nu ai indicat un echilibru corect.",
+        }
+
+    # 4) Complet greșit
+    return {
+        "score": 0,
+        "feedback": "Răspuns incorect. Încearcă să identifici perechile unde ambii jucători au răspunsuri optime.",
+    }
+
+
+# -------------------------------------------------
+# Depozitul de bareme
+# -------------------------------------------------
+
+def register_question(correct_equilibria: List[str]) -> str:
+    """Păstrează baremul (normalizat o dată) și întoarce id-ul întrebării."""
+    return register_key(AnswerKey(correct_equilibria))
+
+
+def register_key(key: AnswerKey) -> str:
+    """Ca `register_question`, pentru un barem deja construit (ex. din banca de întrebări)."""
+    question_id = uuid.uuid4().hex
+    answer_keys.put(question_id, key, cost=1 + key.total)
+    return question_id
+
+
+def score_batch(items: Iterable[Tuple[str, str]]) -> List[Optional[Dict]]:
+    """
+    Scorează perechile (question_id, răspuns), în ordine. None pentru o întrebare
+    necunoscută sau expirată. Fiecare barem se caută o dată, iar fiecare răspuns
+    distinct la o întrebare se scorează o dată.
+    """
+    keys: Dict[str, Optional[AnswerKey]] = {}
+    memo: Dict[Tuple[str, str], Dict] = {}
+    results: List[Optional[Dict]] = []
+    for question_id, answer in items:
+        if question_id not in keys:
+            keys[question_id] = answer_keys.get(question_id)
+        key = keys[question_id]
+        if key is None:
+            results.append(None)
+            continue
+        cached = memo.get((question_id, answer))
+        if cached is None:
+            cached = memo[(question_id, answer)] = score_answer(key, answer)
+        results.append(cached)
+    return results
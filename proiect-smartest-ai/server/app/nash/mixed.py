@@ -0,0 +1,223 @@
+"""
+Echilibre Nash în strategii mixte pentru jocuri bimatriceale.
+
+Două metode:
+  - Lemke–Howson: pivotare complementară pe cele două politoape de best-response;
+    găsește repede un echilibru, pornind de la o etichetă aleasă;
+  - enumerarea suporturilor: pentru fiecare pereche de suporturi (I, J) de aceeași
+    mărime, strategia lui 2 pe J trebuie să-l facă pe 1 indiferent pe I (și invers).
+    Sistemele liniare pentru un I fixat și toate J-urile candidate se rezolvă
+    într-un singur apel `np.linalg.solve` pe un tablou de matrici.
+
+Înainte de căutare, jocul se reduce prin dominanță strictă iterată (care păstrează
+toate echilibrele), iar pentru fiecare suport I al jucătorului 1 se scot coloanele
+strict dominate condiționat de I. Suporturile de mărimi egale sunt suficiente
+pentru jocurile nedegenerate; pentru jocurile degenerate se găsesc echilibrele
+extreme cu suporturi egale (inclusiv toate cele pure).
+"""
+
+import time
+from itertools import combinations
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from .dominance import _dominated, eliminate_dominated
+
+_EPS = 1e-9
+_MAX_PIVOTS = 10_000
+
+
+class MixedResult(NamedTuple):
+    equilibria: List[Tuple[np.ndarray, np.ndarray]]  # (x, y) pe strategiile originale
+    method: str                                      # "lemke_howson" | "support_enumeration"
+    complete: bool                                   # False dacă bugetul de timp s-a terminat
+
+
+class _Timeout(Exception):
+    pass
+
+
+# -------------------------------------------------
+# Verificare
+# -------------------------------------------------
+
+def is_equilibrium(A: np.ndarray, B: np.ndarray, x: np.ndarray, y: np.ndarray, eps: float = 1e-7) -> bool:
+    """Niciun jucător nu câștigă deviind la o strategie pură."""
+    if (x < -eps).any() or (y < -eps).any() or abs(x.sum() - 1) > eps or abs(y.sum() - 1) > eps:
+        return False
+    return bool((A @ y).max() <= x @ A @ y + eps and (x @ B).max() <= x @ B @ y + eps)
+
+
+# -------------------------------------------------
+# Lemke–Howson
+# -------------------------------------------------
+
+def _pivot(tableau: np.ndarray, basis: List[int], entering: int, slack_cols: List[int]) -> int:
+    """Pivotează eticheta `entering` în bază (raport minim lexicografic); întoarce eticheta ieșită."""
+    column = tableau[:, entering]
+    candidates = [r for r in range(len(basis)) if column[r] > _EPS]
+    if not candidates:
+        raise ArithmeticError("Politop nemărginit: jocul trebuie să aibă câștiguri pozitive.")
+    # regula lexicografică evită ciclarea în jocurile degenerate
+    order = [-1] + slack_cols
+    row = min(candidates, key=lambda r: tuple(tableau[r, c] / column[r] for c in order))
+    tableau[row] /= tableau[row, entering]
+    for r in range(len(basis)):
+        if r != row and tableau[r, entering]:
+            tableau[r] -= tableau[r, entering] * tableau[row]
+    leaving, basis[row] = basis[row], entering
+    return leaving
+
+
+def lemke_howson(A: np.ndarray, B: np.ndarray, initial_label: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Un echilibru (x, y), pornind de la eticheta `initial_label` (0..m-1 pentru rânduri,
+    m..m+n-1 pentru coloane). Etichetele sunt și indicii coloanelor din tablouri.
+    """
+    m, n = A.shape
+    # câștiguri strict pozitive, ca politoapele să fie mărginite (echilibrele nu se schimbă)
+    A = A - A.min() + 1.0
+    B = B - B.min() + 1.0
+
+    # x: B^T x + s = 1, coloane [x_0..x_{m-1} | s_0..s_{n-1} | rhs]
+    x_tab = np.hstack([B.T, np.eye(n), np.ones((n, 1))])
+    x_basis = list(range(m, m + n))
+    # y: r + A y = 1, coloane [r_0..r_{m-1} | y_0..y_{n-1} | rhs]
+    y_tab = np.hstack([np.eye(m), A, np.ones((m, 1))])
+    y_basis = list(range(m))
+
+    tables = [(x_tab, x_basis, list(range(m, m + n))), (y_tab, y_basis, list(range(m)))]
+    side = 0 if initial_label < m else 1
+    entering = initial_label
+    for _ in range(_MAX_PIVOTS):
+        tableau, basis, slack_cols = tables[side]
+        leaving = _pivot(tableau, basis, entering, slack_cols)
+        if leaving == initial_label:
+            break
+        entering, side = leaving, 1 - side
+    else:
+        raise ArithmeticError("Lemke–Howson nu a convers.")
+
+    x, y = np.zeros(m), np.zeros(n)
+    for row, label in enumerate(x_basis):
+        if label < m:
+            x[label] = x_tab[row, -1]
+    for row, label in enumerate(y_basis):
+        if label >= m:
+            y[label - m] = y_tab[row, -1]
+    return x / x.sum(), y / y.sum()
+
+
+# -------------------------------------------------
+# Enumerarea suporturilor
+# -------------------------------------------------
+
+def _indifference_systems(payoff: np.ndarray) -> np.ndarray:
+    """Matricile [[P, -1], [1, 0]] pentru un tablou de matrici P (b, k, k)."""
+    b, k, _ = payoff.shape
+    system = np.zeros((b, k + 1, k + 1))
+    system[:, :k, :k] = payoff
+    system[:, :k, k] = -1.0
+    system[:, k, :k] = 1.0
+    return system
+
+
+def _solve_batch(systems: np.ndarray) -> np.ndarray:
+    """Soluțiile sistemelor `systems` z = [0, ..., 0, 1], într-un singur apel."""
+    b, size, _ = systems.shape
+    rhs = np.zeros((b, size, 1))
+    rhs[:, -1] = 1.0
+    return np.linalg.solve(systems, rhs)[..., 0]
+
+
+def _solve_supports(A: np.ndarray, B: np.ndarray, rows: List[int], col_sets: np.ndarray):
+    """Echilibrele cu suportul `rows` pentru 1 și unul din suporturile `col_sets` pentru 2."""
+    m, n = A.shape
+    k = len(rows)
+    # a[t, i, j] = A[rows[i], J_t[j]] (1 indiferent pe rows); bt[t, j, i] = B[rows[i], J_t[j]]
+    sys_y = _indifference_systems(np.transpose(A[rows][:, col_sets], (1, 0, 2)))
+    sys_x = _indifference_systems(np.transpose(B[rows][:, col_sets], (1, 2, 0)))
+    regular = (np.abs(np.linalg.det(sys_y)) > _EPS) & (np.abs(np.linalg.det(sys_x)) > _EPS)
+    if not regular.any():
+        return
+    col_sets = col_sets[regular]
+    sol_y, sol_x = _solve_batch(sys_y[regular]), _solve_batch(sys_x[regular])
+    y_part, u = sol_y[:, :k], sol_y[:, k]
+    x_part, v = sol_x[:, :k], sol_x[:, k]
+    ok = (y_part >= -_EPS).all(axis=1) & (x_part >= -_EPS).all(axis=1)
+    if not ok.any():
+        return
+
+    b = int(ok.sum())
+    Y = np.zeros((b, n))
+    Y[np.arange(b)[:, None], col_sets[ok]] = y_part[ok]
+    X = np.zeros((b, m))
+    X[:, rows] = x_part[ok]
+    # nicio strategie pură din afara suportului nu aduce mai mult
+    best = ((Y @ A.T).max(axis=1) <= u[ok] + 1e-7) & ((X @ B).max(axis=1) <= v[ok] + 1e-7)
+    for t in np.flatnonzero(best):
+        yield np.clip(X[t], 0, None), np.clip(Y[t], 0, None)
+
+
+def support_enumeration(A: np.ndarray, B: np.ndarray, deadline: Optional[float] = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """Echilibrele cu suporturi de mărimi egale, de la suporturile mici la cele mari."""
+    m, n = A.shape
+    for k in range(1, min(m, n) + 1):
+        all_cols = np.array(list(combinations(range(n), k)), dtype=np.intp)
+        for rows in combinations(range(m), k):
+            if deadline is not None and time.perf_counter() > deadline:
+                raise _Timeout()
+            rows = list(rows)
+            # coloanele strict dominate când 1 joacă doar pe `rows` nu pot fi în suport
+            dominated = list(_dominated(B[rows].T, weak=False)) if n > 1 else []
+            col_sets = all_cols[~np.isin(all_cols, dominated).any(axis=1)] if dominated else all_cols
+            if len(col_sets):
+                yield from _solve_supports(A, B, rows, col_sets)
+
+
+# -------------------------------------------------
+# Punctul de intrare
+# -------------------------------------------------
+
+def mixed_equilibria(p1, p2, mode: str = "first", time_limit: Optional[float] = None) -> MixedResult:
+    """
+    mode: "first" – un echilibru (Lemke–Howson, cu enumerare ca rezervă);
+          "all"   – toate echilibrele găsite prin enumerare până la `time_limit` secunde.
+    """
+    deadline = time.perf_counter() + time_limit if time_limit else None
+    A0, B0 = np.asarray(p1, dtype=float), np.asarray(p2, dtype=float)
+    red = eliminate_dominated(A0, B0)
+    A, B = red.p1, red.p2
+    m0, n0 = A0.shape
+
+    def lift(x, y):
+        X, Y = np.zeros(m0), np.zeros(n0)
+        X[red.rows], Y[red.cols] = x, y
+        return X, Y
+
+    if mode == "first":
+        for label in range(sum(A.shape)):
+            try:
+                x, y = lemke_howson(A, B, label)
+            except ArithmeticError:
+                continue
+            if is_equilibrium(A, B, x, y):
+                return MixedResult([lift(x, y)], "lemke_howson", True)
+            if deadline is not None and time.perf_counter() > deadline:
+                return MixedResult([], "lemke_howson", False)
+
+    found, seen = [], set()
+    complete = True
+    try:
+        for x, y in support_enumeration(A, B, deadline):
+            key = tuple(np.round(np.concatenate([x, y]), 9))
+            if key in seen:
+                continue
+            seen.add(key)
+            found.append(lift(x, y))
+            if mode == "first":
+                break
+    except _Timeout:
+        complete = False
+    return MixedResult(found, "support_enumeration", complete)
@@ -1,5 +1,5 @@
-from typing import List
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, Field, model_validator
 
 class NashProblem(BaseModel):
     p1_payoffs: List[List[int]] = Field(..., example=[[3, 1], [0, 2]])
@@ -7,6 +7,20 @@ class NashProblem(BaseModel):
     p1_strategies: List[str] = Field(..., example=["Sus", "Jos"])
     p2_strategies: List[str] = Field(..., example=["Stânga", "Dreapta"])
 
+    @model_validator(mode="after")
+    def _same_shape(self):
+        # solverii citesc dimensiunile din p1; un p2 de altă formă ar fi trunchiat sau ar da 500
+        rows = len(self.p1_payoffs)
+        cols = len(self.p1_payoffs[0]) if rows else 0
+        if rows == 0 or cols == 0:
+            raise ValueError("Jocul trebuie să aibă cel puțin un rând și o coloană.")
+        for name, matrix in (("p1_payoffs", self.p1_payoffs), ("p2_payoffs", self.p2_payoffs)):
+            if len(matrix) != rows or any(len(row) != cols for row in matrix):
+                raise ValueError(f"{name} trebuie să fie o matrice {rows} × {cols}, ca p1_payoffs.")
+        if len(self.p1_strategies) != rows or len(self.p2_strategies) != cols:
+            raise ValueError("Numărul de etichete nu corespunde formei jocului.")
+        return self
+
 class NashEquilibrium(BaseModel):
     row: int
     col: int
@@ -17,6 +31,70 @@ class SolveResponse(BaseModel):
     equilibria: List[NashEquilibrium]
     message: str
 
+class DominanceStep(BaseModel):
+    round: int
+    player: int          # 1 = rânduri, 2 = coloane
+    index: int           # indicele original al strategiei eliminate
+    strategy: str
+    dominated_by: str
+    kind: str            # "strict" | "weak"
+
+class ReduceResponse(BaseModel):
+    p1_payoffs: List[List[int]]
+    p2_payoffs: List[List[int]]
+    p1_strategies: List[str]
+    p2_strategies: List[str]
+    row_map: List[int]   # rândul redus k = rândul original row_map[k]
+    col_map: List[int]
+    trace: List[DominanceStep]
+    equilibria: List[NashEquilibrium]  # echilibre pure ale jocului redus, în indici originali
+    message: str
+
+class MixedEquilibrium(BaseModel):
+    p1: List[float]      # probabilitățile strategiilor jucătorului 1
+    p2: List[float]
+    p1_payoff: float
+    p2_payoff: float
+    name: str
+
+class MixedSolveResponse(BaseModel):
+    equilibria: List[MixedEquilibrium]
+    method: str          # "lemke_howson" | "support_enumeration"
+    complete: bool       # False dacă bugetul de timp s-a terminat înainte de final
+    message: str
+
 class EvaluateRequest(BaseModel):
     student_answer: str
     correct_equilibria: List[str]
+
+class NPlayerProblem(BaseModel):
+    # strategiile fiecărui jucător; payoffs[i] = câștigurile jucătorului i, plate (row-major)
+    shape: List[int] = Field(..., example=[2, 2, 2])
+    payoffs: List[List[float]]
+    strategies: Optional[List[List[str]]] = None
+
+class NPlayerEquilibrium(BaseModel):
+    profile: List[int]
+    name: str
+
+class NPlayerSolveResponse(BaseModel):
+    has_equilibrium: bool
+    equilibria: List[NPlayerEquilibrium]
+    message: str
+
+class BatchAnswer(BaseModel):
+    question_id: str
+    student_answer: str
+
+class EvaluateBatchRequest(BaseModel):
+    answers: List[BatchAnswer]
+
+class BatchResult(BaseModel):
+    question_id: str
+    score: Optional[int]  # None dacă întrebarea nu (mai) există pe server
+    feedback: str
+
+class EvaluateBatchResponse(BaseModel):
+    results: List[BatchResult]
+    graded: int
+    average: Optional[float] = None
@@ -0,0 +1,101 @@
+"""
+Banca de întrebări Nash: jocuri construite dinainte, cu soluția și baremul gata calculate.
+
+Întrebările implicite pentru `/nash/generate` stau într-o coadă umplută de un
+thread de fundal. Servirea unei întrebări este un `popleft()` plus înregistrarea
+baremului, deci nu depinde de câte cereri vin deodată. Când coada scade sub
+pragul minim, thread-ul e trezit și o umple la loc; dacă totuși e goală, întrebarea
+se construiește pe loc (construcția e oricum O(rânduri × coloane)).
+"""
+
+import os
+import random
+import threading
+from collections import deque
+from typing import Dict, Optional
+
+from .engine import pure_nash
+from .grading import AnswerKey, register_key
+from .question_generator import build_nash_game
+
+POOL_SIZE = int(os.getenv("NASH_POOL_SIZE", "512"))
+LOW_WATER = POOL_SIZE // 4
+
+
+def prepare_question(rows: int, cols: int, equilibria: int, dominated: int = 0,
+                     seed: Optional[int] = None) -> Dict:
+    """Jocul construit, echilibrele lui pure (ca nume) și baremul normalizat."""
+    game = build_nash_game(rows, cols, equilibria, dominated, seed)
+    names = [
+        f"({game['p1_strategies'][r]}, {game['p2_strategies'][c]})"
+        for r, c in pure_nash(game["p1_payoffs"], game["p2_payoffs"])
+    ]
+    return {"game": game, "equilibria": names, "key": AnswerKey(names)}
+
+
+def _default_question(rng: random.Random) -> Dict:
+    # aceleași dimensiuni ca generatorul inițial (2x2 sau 3x3), cu 0..n echilibre pure
+    n = rng.choice([2, 3])
+    return prepare_question(n, n, rng.randint(0, n), seed=rng.getrandbits(64))
+
+
+class QuestionBank:
+    def __init__(self, capacity: int = POOL_SIZE, low_water: int = LOW_WATER):
+        self.capacity = capacity
+        self.low_water = low_water
+        self._pool: "deque[Dict]" = deque()
+        self._wake = threading.Event()
+        self._rng = random.Random()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.served = 0
+        self.misses = 0   # întrebări construite pe loc, cu coada goală
+
+    def _ensure_refiller(self) -> None:
+        # pornit la prima cerere, nu la import (importul are loc și în workerii din pool)
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._wake.set()
+                    self._thread = threading.Thread(target=self._refill, name="nash-question-bank", daemon=True)
+                    self._thread.start()
+
+    def _refill(self) -> None:
+        rng = random.Random()
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while len(self._pool) < self.capacity:
+                self._pool.append(_default_question(rng))
+
+    def pop(self) -> Dict:
+        """O întrebare pregătită, cu baremul înregistrat sub un `question_id` nou."""
+        self._ensure_refiller()
+        try:
+            prepared = self._pool.popleft()
+        except IndexError:
+            self.misses += 1
+            prepared = _default_question(self._rng)
+        if len(self._pool) < self.low_water:
+            self._wake.set()
+        self.served += 1
+        return serve(prepared)
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._pool), "capacity": self.capacity, "served": self.served, "misses": self.misses}
+
+
+def serve(prepared: Dict) -> Dict:
+    """Forma răspunsului pentru `/nash/generate`."""
+    game = prepared["game"]
+    return {
+        "question_id": register_key(prepared["key"]),
+        "question": game["question_text"],
+        "p1_strategies": game["p1_strategies"],
+        "p2_strategies": game["p2_strategies"],
+        "p1_payoffs": game["p1_payoffs"],
+        "p2_payoffs": game["p2_payoffs"],
+    }
+
+
+questions = QuestionBank()
@@ -1,5 +1,13 @@
 import random
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+QUESTIONS = [
+    "Identificați echilibrul Nash (dacă există) pentru jocul următor:",
+    "Pentru jocul de mai jos, există echilibru Nash pur?",
+    "Care este echilibrul Nash în strategii pure pentru acest joc?",
+    "Se poate determina un echilibru Nash pentru următorul joc?",
+    "Există o pereche de strategii care formează echilibru Nash?"
+]
 
 def generate_random_nash_question() -> Dict:
     # număr de strategii (2x2, 3x3 etc.)
@@ -35,14 +43,7 @@ def generate_random_nash_question() -> Dict:
     p2_payoffs = [[random.randint(0, 5) for _ in range(n)] for _ in range(n)]
 
     # alegem o formulare de întrebare random
-    questions = [
-        "Identificați echilibrul Nash (dacă există) pentru jocul următor:",
-        "Pentru jocul de mai jos, există echilibru Nash pur?",
-        "Care este echilibrul Nash în strategii pure pentru acest joc?",
-        "Se poate determina un echilibru Nash pentru următorul joc?",
-        "Există o pereche de strategii care formează echilibru Nash?"
-    ]
-    question_text = random.choice(questions)
+    question_text = random.choice(QUESTIONS)
 
     return {
         "p1_payoffs": p1_payoffs,
@@ -51,3 +52,153 @@ def generate_random_nash_question() -> Dict:
         "p2_strategies": p2_strategies,
         "question_text": question_text
     }
+
+
+# -------------------------------------------------
+# Generare constructivă (număr dat de echilibre pure)
+# -------------------------------------------------
+
+_LOW, _HIGH = 2, 9  # câștigurile de bază; strategiile dominate coboară până la 0
+
+
+def _strategy_labels(rng: random.Random, rows: int, cols: int):
+    """Etichete în stilul jocurilor 2x2 / 3x3 de mai sus; pentru jocuri mai mari, numerotate."""
+    if rows > 3 or cols > 3:
+        return [f"Rând{i + 1}" for i in range(rows)], [f"Col{j + 1}" for j in range(cols)]
+    p1 = rng.choice([["Sus", "Jos"], ["U", "D"], ["A", "B"], ["X", "Y"]])[:rows]
+    p2 = rng.choice([["Stânga", "Dreapta"], ["L", "R"], ["X", "Y"], ["Stg", "Dr"]])[:cols]
+    if rows == 3:
+        p1.append(rng.choice(["Mijloc", "C", "M"]))
+    if cols == 3:
+        p2.append(rng.choice(["Centru", "M", "C"]))
+    return p1, p2
+
+
+def _payoffs_with_best(rng: random.Random, size: int, best: int) -> List[int]:
+    """`size` câștiguri în care poziția `best` este maximul strict."""
+    top = rng.randint(_LOW + 1, _HIGH)
+    return [top if i == best else rng.randint(_LOW, top - 1) for i in range(size)]
+
+
+def _undominate(rng: random.Random, lines: List[List[int]], best: Dict[int, int]) -> None:
+    """
+    Corectează pe loc câștigurile unui jucător (`lines[a][k]` = strategia a contra
+    strategiei k a adversarului, `best[k]` = răspunsul optim strict la k) până când
+    nicio strategie nu e strict dominată de alta. O strategie a dominată de b primește
+    valoarea lui b contra unui k cu best[k] ≠ b; acolo ambele sunt sub maxim, deci
+    răspunsurile optime nu se schimbă. Imposibil doar dacă `best` e constant.
+    """
+    changed = True
+    while changed:
+        changed = False
+        for a, line in enumerate(lines):
+            for b, other in enumerate(lines):
+                if a != b and all(x < y for x, y in zip(line, other)):
+                    spots = [k for k in best if best[k] != b]
+                    if not spots:
+                        return
+                    k = rng.choice(spots)
+                    line[k] = other[k]
+                    changed = True
+
+
+def build_nash_game(rows: int, cols: int, equilibria: int, dominated: int = 0,
+                    seed: Optional[int] = None) -> Dict:
+    """
+    Construiește direct un joc rows × cols cu exact `equilibria` echilibre pure,
+    fără generare-și-verificare. `dominated` rânduri și tot atâtea coloane din
+    aceste dimensiuni sunt strict dominate; echilibrele stau în restul jocului.
+
+    Echilibrele stau pe rânduri și coloane distincte (r_i, c_i): acolo fiecare
+    jucător are maximul strict al câștigului (pe coloană pentru 1, pe rând pentru 2).
+    Pentru restul coloanelor alegem răspunsul optim σ(c) al lui 1, pentru restul
+    rândurilor răspunsul τ(r) al lui 2, astfel încât să nu existe σ(c) = r și
+    τ(r) = c simultan; fără echilibre, σ și τ formează un ciclu. Câștigurile care
+    nu sunt maxime se corectează apoi ca nicio strategie din nucleu să nu fie strict
+    dominată, iar rândurile și coloanele dominate se adaugă dominate de câte una din
+    nucleu pe tot jocul. Eliminarea iterată a strategiilor strict dominate scoate deci
+    exact cele `dominated` rânduri și coloane, cu excepția nucleelor care se reduc
+    oricum: 1 × n (strategiile fără răspuns optim ale lui 2 sunt dominate) și 2 × 2
+    cu un singur echilibru. La final rândurile și coloanele se amestecă.
+    """
+    rng = random.Random(seed)
+    if dominated < 0 or dominated >= min(rows, cols):
+        raise ValueError("Strategiile dominate trebuie să lase cel puțin un rând și o coloană nedominate.")
+    rows, cols = rows - dominated, cols - dominated
+    if not 0 <= equilibria <= min(rows, cols):
+        raise ValueError("Numărul de echilibre trebuie să fie între 0 și min(rânduri, coloane) - dominate.")
+    if equilibria == 0 and min(rows, cols) < 2:
+        raise ValueError("Un joc cu o singură strategie pentru un jucător are mereu echilibru pur.")
+
+    eq_rows = rng.sample(range(rows), equilibria)
+    eq_cols = rng.sample(range(cols), equilibria)
+    free_rows = [r for r in range(rows) if r not in eq_rows]
+    free_cols = [c for c in range(cols) if c not in eq_cols]
+    sigma = dict(zip(eq_cols, eq_rows))   # coloană -> răspunsul optim al lui 1
+    tau = dict(zip(eq_rows, eq_cols))     # rând -> răspunsul optim al lui 2
+
+    if equilibria == 0:
+        # ciclu: τ(r_i) = c_{i mod n}, σ(c_j) = r_{(j + 1) mod m}
+        rng.shuffle(free_rows)
+        rng.shuffle(free_cols)
+        for i, r in enumerate(free_rows):
+            tau[r] = free_cols[i % cols]
+        for j, c in enumerate(free_cols):
+            sigma[c] = free_rows[(j + 1) % rows]
+    else:
+        for c in free_cols:
+            sigma[c] = rng.randrange(rows)
+        for r in free_rows:
+            tau[r] = rng.randrange(cols)
+            if tau[r] in free_cols and sigma[tau[r]] == r:
+                tau[r] = rng.choice(eq_cols)
+        if equilibria == 1 and min(rows, cols) > 1:
+            # σ și τ nu pot fi constante (rândul / coloana echilibrului ar domina tot);
+            # în 2 × 2 nu se poate evita
+            if len(free_rows) > 1:
+                ra, rb = rng.sample(free_rows, 2)
+                c = rng.choice(free_cols)
+                sigma[c], tau[rb] = ra, c
+                if tau[ra] == c:
+                    tau[ra] = eq_cols[0]
+            elif len(free_cols) > 1:
+                ca, cb = rng.sample(free_cols, 2)
+                tau[free_rows[0]], sigma[ca], sigma[cb] = ca, eq_rows[0], free_rows[0]
+
+    p1_cols = {c: _payoffs_with_best(rng, rows, sigma[c]) for c in range(cols)}
+    p1 = [[p1_cols[c][r] for c in range(cols)] for r in range(rows)]
+    p2_cols = [[] for _ in range(cols)]
+    for r in range(rows):
+        for c, v in enumerate(_payoffs_with_best(rng, cols, tau[r])):
+            p2_cols[c].append(v)
+    _undominate(rng, p1, sigma)
+    _undominate(rng, p2_cols, tau)
+    p2 = [[p2_cols[c][r] for c in range(cols)] for r in range(rows)]
+
+    # coloane strict dominate pentru 2 de o coloană din nucleu, apoi rânduri strict
+    # dominate pentru 1 de un rând din nucleu, pe toate coloanele (și cele adăugate)
+    col_bases = [rng.randrange(cols) for _ in range(dominated)]
+    for r in range(rows):
+        p2[r] += [p2[r][base] - rng.randint(1, 2) for base in col_bases]
+        p1[r] += [rng.randint(_LOW, _HIGH) for _ in col_bases]
+    for _ in range(dominated):
+        base = rng.randrange(rows)
+        p1.append([v - rng.randint(1, 2) for v in p1[base]])
+        free = [rng.randint(_LOW, _HIGH) for _ in range(cols)]
+        p2.append(free + [free[base] - rng.randint(1, 2) for base in col_bases])
+
+    row_order = list(range(len(p1)))
+    col_order = list(range(len(p1[0])))
+    rng.shuffle(row_order)
+    rng.shuffle(col_order)
+    p1 = [[p1[r][c] for c in col_order] for r in row_order]
+    p2 = [[p2[r][c] for c in col_order] for r in row_order]
+    p1_strategies, p2_strategies = _strategy_labels(rng, len(p1), len(p1[0]))
+
+    return {
+        "p1_payoffs": p1,
+        "p2_payoffs": p2,
+        "p1_strategies": p1_strategies,
+        "p2_strategies": p2_strategies,
+        "question_text": rng.choice(QUESTIONS),
+    }
@@ -0,0 +1,55 @@
+"""
+Formatul compact al unui joc bimatriceal (vezi și app/wire.py).
+
+JSON / msgpack:
+    {"rows": 2, "cols": 2, "p1": [3, 1, 0, 2], "p2": [3, 0, 1, 2]}
+cu câștigurile plate, row-major (p1[r * cols + c]); tablourile pot fi și bytes
+int32 little-endian.
+
+Binar (little-endian): b"NSH1", rows, cols (uint32), apoi p1 și p2 ca int32.
+
+Răspunsul are aceeași codificare: {"equilibria": [r0, c0, r1, c1, ...]} sau, în
+binar, perechile (rând, coloană) ca tablou int32 plat.
+"""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from app.wire import BINARY, dump_document, int_buffer, int_field, load_document, pack_ints, read_header
+
+MAGIC = b"NSH1"
+
+
+def decode_game(body: bytes, kind: str) -> Tuple[int, int, Sequence[int], Sequence[int]]:
+    """(rows, cols, p1, p2) cu p1 / p2 plate; ValueError dacă jocul e invalid."""
+    if kind == BINARY:
+        rows, cols = read_header(body, MAGIC, 2)
+        offset = len(MAGIC) + 8
+        p1 = int_buffer(body, offset, rows * cols)
+        p2 = int_buffer(body, offset + 4 * rows * cols, rows * cols)
+        if offset + 8 * rows * cols != len(body):
+            raise ValueError("Buffer binar cu octeți în plus.")
+    else:
+        doc = load_document(body, kind)
+        rows, cols = doc.get("rows"), doc.get("cols")
+        if type(rows) is not int or type(cols) is not int:
+            raise ValueError("Câmpurile 'rows' și 'cols' trebuie să fie întregi.")
+        p1, p2 = int_field(doc, "p1"), int_field(doc, "p2")
+    if rows < 1 or cols < 1:
+        raise ValueError("Jocul trebuie să aibă cel puțin un rând și o coloană.")
+    if len(p1) != rows * cols or len(p2) != rows * cols:
+        raise ValueError("p1 și p2 trebuie să aibă rows * cols elemente.")
+    return rows, cols, p1, p2
+
+
+def encode_game(rows: int, cols: int, p1: Sequence[int], p2: Sequence[int]) -> bytes:
+    return MAGIC + pack_ints([rows, cols]) + pack_ints(p1) + pack_ints(p2)
+
+
+def encode_equilibria(equilibria: np.ndarray, kind: str) -> bytes:
+    """`equilibria` e tabloul (k, 2) de indici întors de motorul vectorizat."""
+    flat = np.asarray(equilibria, dtype="<i4").ravel()
+    if kind == BINARY:
+        return flat.tobytes()
+    return dump_document({"equilibria": flat.tolist()}, kind)
@@ -0,0 +1,231 @@
+"""
+Metrici în proces (contoare, gauge-uri, histograme) și textul lor Prometheus.
+
+Modulul nu depinde de FastAPI: solverii CSP îl importă pentru `publish_search`,
+inclusiv în procesele worker (joburi, portofoliu, componente în paralel), unde
+nu vrem să încărcăm serverul web. Partea HTTP (middleware, `/metrics`) e în
+`app.metrics`.
+
+Solverii își adună statisticile (noduri, apeluri `is_valid`, verificări, tăieri,
+backtrack-uri) în variabile locale și le publică o singură dată per rezolvare,
+deci bucla de căutare nu atinge contoarele. Contoarele sunt per proces: un
+worker își adună publicările cu `capture_searches()`, le trimite înapoi odată cu
+rezultatul, iar procesul principal le adaugă la contoarele lui cu `replay`.
+"""
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+_registry: List["_Metric"] = []
+
+
+# -------------------------------------------------
+# Tipuri de metrici
+# -------------------------------------------------
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Sequence[str], values: Tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric(ABC):
+    """
+    O metrică cu etichete. `labels(...)` întoarce seria pentru un set de etichete;
+    seria se poate păstra de apelant, ca pe drumul fierbinte să nu mai construim cheia.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labels)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        _registry.append(self)
+
+    @abstractmethod
+    def _new_child(self):
+        """Seria nouă (valoare sau histogramă) pentru un set de etichete."""
+
+    def labels(self, **labels: str):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted(self._children.items())
+        for key, child in items:
+            yield f"{self.name}{_labels(self.labelnames, key)} {_number(child.value)}"
+
+    def render(self) -> str:
+        head = f"# HELP {self.name} {self.documentation}\n# TYPE {self.name} {self.kind}\n"
+        return head + "".join(line + "\n" for line in self.samples())
+
+
+class _Value:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self, lock: threading.Lock):
+        self.value = 0
+        self._lock = lock
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def set_max(self, value: float) -> None:
+        """Păstrează maximul văzut (ex. cel mai mare payload)."""
+        with self._lock:
+            if value > self.value:
+                self.value = value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value(self._lock)
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        self.labels(**labels).inc(amount)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def _new_child(self) -> _Value:
+        return _Value(self._lock)
+
+    def set(self, value: float, **labels: str) -> None:
+        self.labels(**labels).set(value)
+
+    def set_max(self, value: float, **labels: str) -> None:
+        self.labels(**labels).set_max(value)
+
+
+# limitele implicite din clienții Prometheus, în secunde
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class _Series:
+    __slots__ = ("buckets", "counts", "sum", "count", "_lock")
+
+    def __init__(self, buckets: Tuple[float, ...], lock: threading.Lock):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # ultimul interval e +Inf
+        self.sum = 0.0
+        self.count = 0
+        self._lock = lock
+
+    def observe(self, value: float) -> None:
+        slot = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[slot] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _Series:
+        return _Series(self.buckets, self._lock)
+
+    def observe(self, value: float, **labels: str) -> None:
+        self.labels(**labels).observe(value)
+
+    def samples(self) -> Iterable[str]:
+        with self._lock:
+            items = sorted((key, [*child.counts], child.sum, child.count)
+                           for key, child in self._children.items())
+        for key, counts, total, n in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                bucket = _labels(self.labelnames, key, 'le="' + le + '"')
+                yield f"{self.name}_bucket{bucket} {cumulative}"
+            yield f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}"
+            yield f"{self.name}_count{_labels(self.labelnames, key)} {n}"
+
+
+def render() -> str:
+    return "".join(metric.render() for metric in _registry)
+
+
+# -------------------------------------------------
+# Contoarele solverilor CSP
+# -------------------------------------------------
+
+SOLVES = Counter("smartest_csp_solves_total", "Rezolvări CSP rulate (fără hit-urile din cache).", ("solver",))
+_SEARCH_COUNTERS = {
+    "nodes": Counter("smartest_csp_nodes_total", "Noduri expandate de căutare.", ("solver",)),
+    "is_valid": Counter("smartest_csp_is_valid_calls_total", "Apeluri is_valid.", ("solver",)),
+    "checks": Counter("smartest_csp_checks_total", "Verificări de constrângeri la propagare.", ("solver",)),
+    "prunes": Counter("smartest_csp_prunes_total", "Valori tăiate din domenii.", ("solver",)),
+    "backtracks": Counter("smartest_csp_backtracks_total", "Reveniri din fundături.", ("solver",)),
+}
+
+
+Published = List[Tuple[str, Dict[str, int]]]
+
+_capture = threading.local()
+
+
+def publish_search(solver: str, stats: Dict[str, int]) -> None:
+    """Adaugă statisticile unei rezolvări la contoarele solverului (o dată per rezolvare)."""
+    captured = getattr(_capture, "published", None)
+    if captured is not None:
+        captured.append((solver, dict(stats)))
+        return
+    SOLVES.inc(solver=solver)
+    for stat, counter in _SEARCH_COUNTERS.items():
+        value = stats.get(stat)
+        if value:
+            counter.inc(value, solver=solver)
+
+
+@contextmanager
+def capture_searches() -> Iterator[Published]:
+    """
+    Publicările din blocul `with` (în thread-ul curent) se adună într-o listă în loc
+    să ajungă la contoare. Folosit în procesele worker, ale căror contoare nu se văd.
+    """
+    previous = getattr(_capture, "published", None)
+    _capture.published = published = []
+    try:
+        yield published
+    finally:
+        _capture.published = previous
+
+
+def replay(published: Published) -> None:
+    """Publică, în procesul curent, statisticile adunate de `capture_searches` într-un worker."""
+    for solver, stats in published:
+        publish_search(solver, stats)
@@ -0,0 +1,118 @@
+"""
+Codificări compacte pentru cererile mari (folosite de app/csp/wire.py și app/nash/wire.py).
+
+Un corp de cerere poate fi:
+  - JSON compact (application/json): etichetele apar o singură dată, restul sunt
+    tablouri plate de întregi;
+  - msgpack (application/msgpack), cu aceeași schemă ca JSON-ul; tablourile pot
+    fi și `bytes` cu int32 little-endian. Necesită pachetul opțional `msgpack`;
+  - binar (application/octet-stream): antet fix + tablouri int32 little-endian.
+
+Tablourile binare sunt citite direct din buffer (memoryview), fără câte un obiect
+Python per element.
+"""
+
+import json
+import struct
+import sys
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+
+try:
+    import msgpack
+except ImportError:  # dependență opțională
+    msgpack = None
+
+JSON = "application/json"
+MSGPACK = "application/msgpack"
+BINARY = "application/octet-stream"
+
+_MSGPACK_ALIASES = {MSGPACK, "application/x-msgpack"}
+
+
+class UnsupportedFormat(Exception):
+    """Tipul de conținut nu e cunoscut sau codificarea lui nu e disponibilă (HTTP 415)."""
+
+
+def media_type(content_type: str) -> str:
+    kind = (content_type or JSON).split(";")[0].strip().lower()
+    if kind in _MSGPACK_ALIASES:
+        if msgpack is None:
+            raise UnsupportedFormat("Suportul msgpack nu este instalat pe server.")
+        return MSGPACK
+    if kind in (JSON, BINARY):
+        return kind
+    raise UnsupportedFormat(f"Tip de conținut nesuportat: {kind}")
+
+
+def load_document(body: bytes, kind: str) -> Dict[str, Any]:
+    """Corpul JSON / msgpack ca dict; ridică ValueError dacă nu e un obiect."""
+    try:
+        doc = json.loads(body) if kind == JSON else msgpack.unpackb(body, raw=False)
+    except Exception as e:
+        raise ValueError(f"Corp invalid: {e}")
+    if not isinstance(doc, dict):
+        raise ValueError("Corpul trebuie să fie un obiect.")
+    return doc
+
+
+def dump_document(doc: Dict[str, Any], kind: str) -> bytes:
+    if kind == MSGPACK:
+        return msgpack.packb(doc, use_bin_type=True)
+    return json.dumps(doc, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def int_buffer(data: bytes, offset: int = 0, count: int = -1) -> Sequence[int]:
+    """`count` întregi int32 little-endian de la `offset`, fără copiere pe mașinile little-endian."""
+    if count < 0:
+        count = (len(data) - offset) // 4
+    end = offset + 4 * count
+    if end > len(data):
+        raise ValueError("Buffer binar trunchiat.")
+    if sys.byteorder == "little":
+        return memoryview(data)[offset:end].cast("i")
+    values = array("i")
+    values.frombytes(data[offset:end])
+    values.byteswap()
+    return values
+
+
+def pack_ints(values: Sequence[int]) -> bytes:
+    buffer = array("i", values)
+    if sys.byteorder != "little":
+        buffer.byteswap()
+    return buffer.tobytes()
+
+
+def int_field(doc: Dict[str, Any], name: str, default=None) -> Sequence[int]:
+    """Un tablou de întregi din JSON/msgpack: listă sau bytes int32 little-endian."""
+    value = doc.get(name, default)
+    if value is None:
+        raise ValueError(f"Lipsește câmpul '{name}'.")
+    if isinstance(value, (bytes, bytearray)):
+        if len(value) % 4:
+            raise ValueError(f"Câmpul '{name}' nu are o lungime multiplu de 4.")
+        return int_buffer(bytes(value))
+    if not isinstance(value, list) or not all(type(x) is int for x in value):
+        raise ValueError(f"Câmpul '{name}' trebuie să fie o listă de întregi.")
+    return value
+
+
+def read_header(data: bytes, magic: bytes, fields: int) -> Tuple[int, ...]:
+    """Verifică semnătura și citește `fields` întregi uint32 din antet."""
+    size = len(magic) + 4 * fields
+    if len(data) < size or data[:len(magic)] != magic:
+        raise ValueError("Antet binar invalid.")
+    return struct.unpack_from(f"<{fields}I", data, len(magic))
+
+
+def read_labels(data: bytes, offset: int, length: int, count: int) -> List[str]:
+    """`count` etichete UTF-8 separate prin octetul 0."""
+    if offset + length > len(data):
+        raise ValueError("Buffer binar trunchiat.")
+    if count == 0:
+        return []
+    labels = data[offset:offset + length].decode("utf-8").split("\0")
+    if len(labels) != count:
+        raise ValueError("Numărul de etichete nu corespunde antetului.")
+    return labels
@@ -0,0 +1,85 @@
+"""
+Client ASGI minimal, în proces: cererile ajung direct la `app(scope, receive, send)`,
+fără socket-uri și fără httpx, deci măsurăm doar serverul (rutare, validare,
+serializare, solver).
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, Optional, Tuple
+
+
+async def call(app, method: str, path: str, body: Optional[bytes] = None,
+               content_type: str = "application/json") -> Tuple[int, bytes]:
+    path, _, query = path.partition("?")
+    body = body or b""
+    headers = [(b"host", b"bench"), (b"content-length", str(len(body)).encode())]
+    if body:
+        headers.append((b"content-type", content_type.encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 0),
+        "server": ("bench", 80),
+    }
+    done = asyncio.Event()
+    request_sent = False
+    status = 0
+    chunks = []
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                done.set()
+
+    await app(scope, receive, send)
+    return status, b"".join(chunks)
+
+
+def throughput(app, method: str, path: str, payload=None, requests: int = 200,
+               concurrency: int = 1) -> Dict:
+    """Cereri pe secundă pentru un endpoint, cu `concurrency` cereri în zbor."""
+    body = json.dumps(payload).encode() if payload is not None else None
+
+    async def worker(count: int, statuses: Dict[int, int]):
+        for _ in range(count):
+            status, _ = await call(app, method, path, body)
+            statuses[status] = statuses.get(status, 0) + 1
+
+    async def run():
+        statuses: Dict[int, int] = {}
+        await call(app, method, path, body)  # încălzire (importuri, cache-uri)
+        share = [requests // concurrency + (1 if i < requests % concurrency else 0) for i in range(concurrency)]
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(n, statuses) for n in share))
+        return time.perf_counter() - start, statuses
+
+    elapsed, statuses = asyncio.run(run())
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "time_s": round(elapsed, 6),
+        "rps": round(requests / elapsed, 1) if elapsed else None,
+        "statuses": {str(k): v for k, v in sorted(statuses.items())},
+    }
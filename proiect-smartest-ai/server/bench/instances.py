@@ -0,0 +1,186 @@
+"""
+Generatoare de instanțe pentru benchmark, toate deterministe (seed explicit).
+
+CSP-urile sunt în formatul cererilor (`variables`, `domains`, `constraints`), deci
+pot fi date direct oricărui solver din app/csp sau endpoint-urilor.
+"""
+
+import random
+from itertools import combinations
+from typing import Dict, List, Tuple
+
+from app.nash.engine import pure_nash_array
+from app.nash.question_generator import build_nash_game
+
+
+# -------------------------------------------------
+# CSP: colorări de grafuri
+# -------------------------------------------------
+
+def colouring(n: int, edges: List[Tuple[int, int]], colours: int, prefix: str = "v") -> Dict:
+    variables = [f"{prefix}{i}" for i in range(n)]
+    palette = [f"c{k}" for k in range(colours)]
+    return {
+        "variables": variables,
+        "domains": {v: list(palette) for v in variables},
+        "constraints": [[variables[i], variables[j]] for i, j in edges],
+    }
+
+
+def queens_graph(n: int, colours: int) -> Dict:
+    """
+    Graful damelor n × n (celule adiacente dacă două dame s-ar ataca), colorat cu
+    `colours` culori. Constrângerile sunt doar inegalități, deci n-queens clasic
+    (cu diagonale) nu se poate scrie direct; colorarea grafului damelor este
+    varianta standard din benchmark-urile DIMACS (queen5_5, queen6_6, ...).
+    """
+    cells = [(r, c) for r in range(n) for c in range(n)]
+    edges = [
+        (i, j) for i, j in combinations(range(len(cells)), 2)
+        if cells[i][0] == cells[j][0] or cells[i][1] == cells[j][1]
+        or abs(cells[i][0] - cells[j][0]) == abs(cells[i][1] - cells[j][1])
+    ]
+    return colouring(len(cells), edges, colours, prefix="q")
+
+
+def random_graph(n: int, density: float, colours: int, seed: int = 0) -> Dict:
+    """Graf aleator G(n, p) cu p = `density`."""
+    rng = random.Random(seed)
+    edges = [(i, j) for i, j in combinations(range(n), 2) if rng.random() < density]
+    return colouring(n, edges, colours)
+
+
+def mycielski_edges(k: int) -> Tuple[int, List[Tuple[int, int]]]:
+    """Graful Mycielski M_k (fără triunghiuri, număr cromatic k). M_2 = K_2."""
+    n, edges = 2, [(0, 1)]
+    for _ in range(k - 2):
+        # copia u_i a lui v_i e legată de vecinii lui v_i; w e legat de toate copiile
+        shadow = [(i, n + j) for i, j in edges] + [(j, n + i) for i, j in edges]
+        apex = [(n + i, 2 * n) for i in range(n)]
+        edges = edges + shadow + apex
+        n = 2 * n + 1
+    return n, edges
+
+
+def mycielski(k: int, colours: int) -> Dict:
+    n, edges = mycielski_edges(k)
+    return colouring(n, edges, colours, prefix="m")
+
+
+def degenerate(kind: str) -> Dict:
+    """
+    Probleme nesatisfiabile doar prin forma constrângerilor: o variabilă diferită de
+    ea însăși sau repetată într-un alldiff. Compilarea le golește domeniul, deci
+    orice solver care întoarce o soluție aici are un bug.
+    """
+    problem = colouring(4, [(0, 1), (1, 2), (2, 3)], 3)
+    if kind == "self_loop":
+        problem["constraints"].append(["v2", "v2"])
+    else:
+        problem["constraints"].append({"type": "alldiff", "variables": ["v0", "v3", "v0"]})
+    return problem
+
+
+def csp_suite(quick: bool = False) -> Dict[str, Dict]:
+    suite = {
+        "self_loop": degenerate("self_loop"),                  # nesatisfiabil
+        "alldiff_duplicate": degenerate("alldiff_duplicate"),  # nesatisfiabil
+        "queens5_c5": queens_graph(5, 5),
+        "queens6_c7": queens_graph(6, 7),
+        "random30_p10_c3": random_graph(30, 0.10, 3, seed=1),
+        "random30_p20_c4": random_graph(30, 0.20, 4, seed=2),
+        "mycielski4_c3": mycielski(4, 3),   # nesatisfiabil
+        "mycielski4_c4": mycielski(4, 4),
+    }
+    if not quick:
+        suite.update({
+            "queens7_c7": queens_graph(7, 7),
+            "random60_p10_c4": random_graph(60, 0.10, 4, seed=3),
+            "random100_p05_c3": random_graph(100, 0.05, 3, seed=4),
+            "mycielski5_c4": mycielski(5, 4),   # nesatisfiabil, greu pentru backtracking simplu
+            "mycielski5_c5": mycielski(5, 5),
+        })
+    return suite
+
+
+# -------------------------------------------------
+# Nash: jocuri bimatriceale
+# -------------------------------------------------
+
+def random_game(rows: int, cols: int, seed: int = 0, high: int = 9) -> Dict:
+    rng = random.Random(seed)
+    return {
+        "p1_payoffs": [[rng.randint(0, high) for _ in range(cols)] for _ in range(rows)],
+        "p2_payoffs": [[rng.randint(0, high) for _ in range(cols)] for _ in range(rows)],
+        "p1_strategies": [f"R{i}" for i in range(rows)],
+        "p2_strategies": [f"C{j}" for j in range(cols)],
+    }
+
+
+def coordination_game(n: int) -> Dict:
+    """Ambii câștigă doar dacă aleg același indice: n echilibre pure, multe mixte."""
+    payoff = [[(i + 1) if i == j else 0 for j in range(n)] for i in range(n)]
+    return {"p1_payoffs": payoff, "p2_payoffs": [row[:] for row in payoff],
+            "p1_strategies": [f"R{i}" for i in range(n)], "p2_strategies": [f"C{j}" for j in range(n)]}
+
+
+def zero_sum_game(n: int, seed: int = 0) -> Dict:
+    game = random_game(n, n, seed)
+    game["p2_payoffs"] = [[-x for x in row] for row in game["p1_payoffs"]]
+    return game
+
+
+def constructed_game(rows: int, cols: int, equilibria: int, dominated: int, seed: int = 0) -> Dict:
+    game = build_nash_game(rows, cols, equilibria, dominated, seed)
+    return {k: game[k] for k in ("p1_payoffs", "p2_payoffs", "p1_strategies", "p2_strategies")}
+
+
+def nash_suite(quick: bool = False) -> Dict[str, Dict]:
+    suite = {
+        "random3": random_game(3, 3, seed=1),
+        "random8": random_game(8, 8, seed=2),
+        "random50": random_game(50, 50, seed=3),
+        "coordination6": coordination_game(6),
+        "zerosum8": zero_sum_game(8, seed=4),
+        "constructed10_k3_d5": constructed_game(10, 10, 3, 5, seed=5),
+    }
+    if not quick:
+        suite.update({
+            "random15": random_game(15, 15, seed=6),
+            "random200": random_game(200, 200, seed=7),
+            "random500": random_game(500, 500, seed=8),
+            "constructed40_k5_d20": constructed_game(40, 40, 5, 20, seed=9),
+        })
+    return suite
+
+
+# -------------------------------------------------
+# Corpus de răspunsuri pentru evaluare
+# -------------------------------------------------
+
+def evaluate_corpus(questions: int, answers_per_question: int, seed: int = 0) -> List[Dict]:
+    """
+    Întrebări construite (2x2 / 3x3) cu echilibrele corecte și răspunsuri tipice:
+    complete, parțiale, greșite, "nu există", cu diacritice și spațieri diferite.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for q in range(questions):
+        n = rng.choice([2, 3])
+        game = build_nash_game(n, n, rng.randint(0, n), seed=rng.getrandbits(32))
+        correct = [f"({game['p1_strategies'][r]}, {game['p2_strategies'][c]})"
+                   for r, c in pure_nash_array(game["p1_payoffs"], game["p2_payoffs"])]
+        labels = game["p1_strategies"] + game["p2_strategies"]
+        answers = []
+        for _ in range(answers_per_question):
+            kind = rng.random()
+            if kind < 0.4 and correct:
+                answers.append("Echilibrele sunt " + " și ".join(rng.sample(correct, rng.randint(1, len(correct)))))
+            elif kind < 0.55:
+                answers.append(rng.choice(["Nu există echilibru pur.", "nu exista", "NU"]))
+            elif kind < 0.8:
+                answers.append(f"({rng.choice(labels)},   {rng.choice(labels).upper()})")
+            else:
+                answers.append(rng.choice(["nu știu", "(A, B, C)", "", "Ştefan"]))
+        corpus.append({"question": f"q{q}", "correct": correct, "answers": answers})
+    return corpus
@@ -0,0 +1,305 @@
+"""
+Benchmark pentru solverii CSP și Nash.
+
+Rulare (din directorul server/):
+
+    python -m bench.run --quick --out bench/results.json
+    python -m bench.run --compare bench/baseline.json --threshold 1.3
+
+Pentru fiecare (suită, instanță, solver) se înregistrează timpul (cel mai bun din
+`--repeat` rulări), nodurile, verificările de constrângeri (unde solverul le
+numără), memoria maximă (tracemalloc, într-o rulare separată, netemporizată) și
+rezultatul. Debitul endpoint-urilor se măsoară prin aplicația ASGI, în proces.
+Cu `--compare`, rezultatele se compară cu un fișier anterior și orice regresie
+peste prag face ca procesul să iasă cu codul 1. Independent de baseline, o soluție
+care încalcă constrângerile sau doi solveri compleți cu verdicte diferite (soluție
+vs. "unsat") pe aceeași instanță sunt erori și dau tot codul 1.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.csp.budget import SearchBudget
+from app.csp.constraints import expand_constraints
+from app.csp.registry import SOLVERS
+from app.main import app
+from app.nash.api import evaluate_answer
+from app.nash.dominance import eliminate_dominated
+from app.nash.engine import pure_nash, pure_nash_array
+from app.nash.grading import AnswerKey, register_question, score_answer, score_batch
+from app.nash.logic import pure_nash_equilibria
+from app.nash.mixed import mixed_equilibria
+from app.nash.models import EvaluateRequest
+
+from . import instances
+from .asgi import throughput
+
+# -------------------------------------------------
+# Măsurare
+# -------------------------------------------------
+
+def measure(run: Callable[[], Dict], repeat: int) -> Dict:
+    """`run()` întoarce contoarele rulării; adăugăm timpul minim și memoria maximă."""
+    best = None
+    info: Dict = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        info = run()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"time_s": round(best, 6), "peak_kib": round(peak / 1024, 1), **info}
+
+
+def _csp_runner(name: str, problem: Dict, time_limit: float) -> Callable[[], Dict]:
+    config = SOLVERS[name]
+
+    def run() -> Dict:
+        budget = SearchBudget(time_limit=time_limit)
+        solution, stats = config.run(problem["variables"], problem["domains"], problem["constraints"], budget=budget)
+        if solution is not None:
+            status = "solved" if _satisfies(problem, solution) else "invalid"
+        elif budget.stopped:
+            status = budget.stopped
+        else:
+            status = "unsat" if config.complete else "not_found"
+        return {
+            "status": status,
+            "nodes": stats.get("nodes", stats.get("moves")),
+            "checks": stats.get("checks", stats.get("is_valid")),
+        }
+    return run
+
+
+def _satisfies(problem: Dict, solution: Dict[str, str]) -> bool:
+    """Soluția atribuie fiecărei variabile o valoare din domeniu și respectă toate constrângerile."""
+    if any(solution.get(v) not in problem["domains"][v] for v in problem["variables"]):
+        return False
+    return all(solution[x] != solution[y] for x, y in expand_constraints(problem["constraints"]))
+
+
+def consistency(results: List[Dict]) -> List[str]:
+    """
+    Erori de corectitudine, independente de baseline: soluții invalide și solveri
+    compleți care nu sunt de acord între ei (unul găsește soluție, altul zice "unsat").
+    """
+    errors = []
+    outcomes: Dict[str, Dict[str, List[str]]] = {}
+    for row in results:
+        if row["suite"] != "csp":
+            continue
+        if row["status"] == "invalid":
+            errors.append(f"{row['instance']} / {row['solver']}: soluție care încalcă constrângerile")
+        elif row["status"] in ("solved", "unsat"):
+            outcomes.setdefault(row["instance"], {}).setdefault(row["status"], []).append(row["solver"])
+    for instance, by_status in outcomes.items():
+        if len(by_status) > 1:
+            errors.append(f"{instance}: solved de {', '.join(by_status['solved'])}, "
+                          f"unsat de {', '.join(by_status['unsat'])}")
+    return errors
+
+
+def run_csp(quick: bool, repeat: int, time_limit: float, solvers: Optional[List[str]]) -> List[Dict]:
+    results = []
+    for instance, problem in instances.csp_suite(quick).items():
+        for name in solvers or SOLVERS:
+            row = measure(_csp_runner(name, problem, time_limit), repeat)
+            results.append({"suite": "csp", "instance": instance, "solver": name, **row})
+            _progress(results[-1])
+    return results
+
+
+def run_nash(quick: bool, repeat: int, time_limit: float) -> List[Dict]:
+    solvers = {
+        "pure_nash_equilibria": lambda g: {"equilibria": len(pure_nash_equilibria(g["p1_payoffs"], g["p2_payoffs"]))},
+        "pure_nash_array": lambda g: {"equilibria": len(pure_nash_array(g["p1_payoffs"], g["p2_payoffs"]))},
+        "pure_nash": lambda g: {"equilibria": len(pure_nash(g["p1_payoffs"], g["p2_payoffs"]))},
+        "eliminate_dominated": lambda g: _reduced(eliminate_dominated(g["p1_payoffs"], g["p2_payoffs"])),
+        "mixed_first": lambda g: _mixed(mixed_equilibria(g["p1_payoffs"], g["p2_payoffs"], "first", time_limit)),
+        "mixed_all": lambda g: _mixed(mixed_equilibria(g["p1_payoffs"], g["p2_payoffs"], "all", time_limit)),
+    }
+    results = []
+    for instance, game in instances.nash_suite(quick).items():
+        size = len(game["p1_payoffs"]) * len(game["p1_payoffs"][0])
+        for name, solve in solvers.items():
+            if name == "mixed_all" and size > 15 * 15:
+                continue  # enumerarea suporturilor e exponențială; o limităm la jocurile de examen
+            if name == "mixed_first" and size > 50 * 50:
+                continue
+            row = measure(lambda: solve(game), repeat)
+            results.append({"suite": "nash", "instance": instance, "solver": name, **row})
+            _progress(results[-1])
+    return results
+
+
+def _reduced(red) -> Dict:
+    return {"rows": len(red.rows), "cols": len(red.cols), "eliminated": len(red.trace)}
+
+
+def _mixed(result) -> Dict:
+    return {"equilibria": len(result.equilibria), "status": "complete" if result.complete else "time"}
+
+
+def run_evaluate(quick: bool, repeat: int) -> List[Dict]:
+    corpus = instances.evaluate_corpus(50 if quick else 300, 30)
+    answers = sum(len(q["answers"]) for q in corpus)
+
+    def per_request() -> Dict:
+        for q in corpus:
+            for answer in q["answers"]:
+                evaluate_answer(EvaluateRequest(student_answer=answer, correct_equilibria=q["correct"]))
+        return {"answers": answers}
+
+    def keyed() -> Dict:
+        for q in corpus:
+            key = AnswerKey(q["correct"])
+            for answer in q["answers"]:
+                score_answer(key, answer)
+        return {"answers": answers}
+
+    ids = [register_question(q["correct"]) for q in corpus]
+    items = [(qid, answer) for qid, q in zip(ids, corpus) for answer in q["answers"]]
+
+    def batch() -> Dict:
+        score_batch(items)
+        return {"answers": answers}
+
+    results = []
+    for name, run in (("evaluate_per_request", per_request), ("score_answer_keyed", keyed), ("score_batch", batch)):
+        results.append({"suite": "evaluate", "instance": f"corpus{len(corpus)}x30", "solver": name,
+                        **measure(run, repeat)})
+        _progress(results[-1])
+    return results
+
+
+def run_throughput(quick: bool) -> List[Dict]:
+    requests = 100 if quick else 500
+    small_csp = instances.random_graph(12, 0.3, 3, seed=5)
+    game = instances.random_game(3, 3, seed=1)
+    corpus = instances.evaluate_corpus(10, 10, seed=2)
+    endpoints = [
+        ("GET", "/", None),
+        ("POST", "/api/v1/csp/solve", small_csp),          # după prima cerere: hit în cache
+        ("POST", "/api/v1/csp/solve-ac3", small_csp),
+        ("POST", "/api/v1/csp/solve-mrv?tie_break=domwdeg&value_order=lcv", small_csp),
+        ("POST", "/api/v1/nash/solve", game),
+        ("POST", "/api/v1/nash/solve-mixed", game),
+        ("GET", "/api/v1/nash/generate", None),
+        ("POST", "/api/v1/nash/evaluate",
+         {"student_answer": corpus[0]["answers"][0], "correct_equilibria": corpus[0]["correct"]}),
+    ]
+    results = []
+    for method, path, payload in endpoints:
+        row = throughput(app, method, path, payload, requests=requests)
+        results.append({"suite": "asgi", "instance": f"{method} {path}", "solver": "app", **row})
+        _progress(results[-1])
+    return results
+
+
+def _progress(row: Dict) -> None:
+    cost = f"{row['rps']} req/s" if "rps" in row else f"{row['time_s'] * 1000:.2f} ms"
+    print(f"  {row['suite']:<9} {row['instance']:<28} {row['solver']:<22} {cost:>14}  {row.get('status', '')}",
+          file=sys.stderr)
+
+
+# -------------------------------------------------
+# Comparare cu un baseline
+# -------------------------------------------------
+
+def compare(current: Dict, baseline: Dict, threshold: float, min_time: float) -> List[str]:
+    """Regresiile (timp, memorie, debit, rezultat diferit) față de baseline, ca text."""
+    old = {(r["suite"], r["instance"], r["solver"]): r for r in baseline.get("results", [])}
+    regressions = []
+    for row in current["results"]:
+        key = (row["suite"], row["instance"], row["solver"])
+        ref = old.get(key)
+        if ref is None:
+            continue
+        label = " / ".join(key)
+        if "rps" in row:
+            if ref.get("rps") and row["rps"] and row["rps"] * threshold < ref["rps"]:
+                regressions.append(f"{label}: {ref['rps']} -> {row['rps']} req/s")
+            continue
+        if ref["time_s"] >= min_time and row["time_s"] > ref["time_s"] * threshold:
+            regressions.append(f"{label}: timp {ref['time_s'] * 1000:.2f} -> {row['time_s'] * 1000:.2f} ms")
+        if row["peak_kib"] > ref["peak_kib"] * threshold and row["peak_kib"] - ref["peak_kib"] > 64:
+            regressions.append(f"{label}: memorie {ref['peak_kib']} -> {row['peak_kib']} KiB")
+        if ref.get("status") in ("solved", "unsat") and row.get("status") != ref["status"]:
+            regressions.append(f"{label}: rezultat {ref['status']} -> {row.get('status')}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark solveri CSP / Nash")
+    parser.add_argument("--quick", action="store_true", help="instanțe mici, pentru CI")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--time-limit", type=float, default=5.0, help="secunde per rulare de solver")
+    parser.add_argument("--suites", default="csp,nash,evaluate,asgi")
+    parser.add_argument("--solvers", default=None, help="configurații CSP din registry, separate prin virgulă")
+    parser.add_argument("--out", default=None, help="fișierul JSON cu rezultatele")
+    parser.add_argument("--compare", default=None, help="baseline JSON cu care se compară")
+    parser.add_argument("--threshold", type=float, default=1.3, help="raportul peste care e regresie")
+    parser.add_argument("--min-time", type=float, default=0.002, help="sub atât (s) timpul nu se compară")
+    args = parser.parse_args(argv)
+
+    suites = set(args.suites.split(","))
+    solvers = args.solvers.split(",") if args.solvers else None
+    results: List[Dict] = []
+    if "csp" in suites:
+        results += run_csp(args.quick, args.repeat, args.time_limit, solvers)
+    if "nash" in suites:
+        results += run_nash(args.quick, args.repeat, args.time_limit)
+    if "evaluate" in suites:
+        results += run_evaluate(args.quick, args.repeat)
+    if "asgi" in suites:
+        results += run_throughput(args.quick)
+
+    report = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "quick": args.quick,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    else:
+        json.dump(report, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+    errors = consistency(results)
+    for line in errors:
+        print(f"EROARE  {line}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold, args.min_time)
+        for line in regressions:
+            print(f"REGRESIE  {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("Nicio regresie față de baseline.", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())